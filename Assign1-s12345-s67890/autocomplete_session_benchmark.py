@@ -0,0 +1,93 @@
+import random
+import sys
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.list_dictionary import ListDictionary
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+from dictionary.autocomplete_session import open_session
+
+
+# -------------------------------------------------------------------
+# Types words from the data file one letter at a time and then erases
+# them with backspace down to the first letter, and compares the mean
+# latency per keystroke of an autocomplete session with a fresh
+# autocomplete call on the whole prefix, for the backends that resume
+# from the previous prefix and for hashtable, which uses the generic
+# session.
+#
+# python3 autocomplete_session_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+TYPED_WORDS = 2000
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 autocomplete_session_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def time_session(agent, typed_words):
+    keystrokes = 0
+    initial_time = timeit.default_timer()
+    for word in typed_words:
+        # erasing down to the first letter, the empty prefix is not autocompleted
+        session = open_session(agent)
+        for letter in word:
+            session.push(letter)
+        for _ in word[1:]:
+            session.pop()
+        keystrokes += 2 * len(word) - 1
+    return (timeit.default_timer() - initial_time) / keystrokes
+
+
+def time_fresh_calls(agent, typed_words):
+    keystrokes = 0
+    initial_time = timeit.default_timer()
+    for word in typed_words:
+        for length in range(1, len(word) + 1):
+            agent.autocomplete(word[:length])
+        for length in range(len(word) - 1, 0, -1):
+            agent.autocomplete(word[:length])
+        keystrokes += 2 * len(word) - 1
+    return (timeit.default_timer() - initial_time) / keystrokes
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words_frequencies = read_data_file(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    typed_words = [random.choice(words_frequencies).word for _ in range(TYPED_WORDS)]
+
+    for title in ['Approach', 'Fresh calls (s/key)', 'Session (s/key)', 'Speed-up']:
+        print(title.ljust(25), end='')
+    print()
+
+    for approach, agent in [('tst', TernarySearchTreeDictionary()), ('sortedlist', ListDictionary(sorted_mode=True)),
+                            ('hashtable', HashTableDictionary())]:
+        agent.build_dictionary(words_frequencies)
+        fresh_time = time_fresh_calls(agent, typed_words)
+        session_time = time_session(agent, typed_words)
+        print(approach.ljust(25) + format(fresh_time, '.8f').ljust(25) + format(session_time, '.8f').ljust(25)
+              + format(fresh_time / session_time, '.2f'))
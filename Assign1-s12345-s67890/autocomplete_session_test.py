@@ -0,0 +1,121 @@
+import random
+import sys
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.approaches import APPROACHES, make_dictionary
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.autocomplete_session import open_session
+
+
+# -------------------------------------------------------------------
+# Checks the keystroke sessions of an approach against a fresh
+# autocomplete of the same prefix, with sessions left open while words
+# are deleted (enough of them for the list to compact) and added back.
+# The first case deletes words in front of the prefix of an open session
+# on a small dictionary; the second types and erases words from the data
+# file with a few sessions open at once. Prints how many checks passed
+# out of how many were run.
+#
+# python3 autocomplete_session_test.py <approach> [data fileName]
+# -------------------------------------------------------------------
+
+CHANGES = 40 # rounds of deletes and adds on the data file dictionary
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 autocomplete_session_test.py', '<approach> [data fileName]')
+    print('<approach> = <' + ' | '.join(APPROACHES) + '>')
+    sys.exit(1)
+
+
+def as_pairs(list_words):
+    return [(item.word, item.frequency) for item in list_words]
+
+
+def check(agent, session, answer, failures):
+    """
+    compare the answer of a session with a fresh autocomplete of its prefix
+    @return: 1, the number of checks run
+    """
+    expected = as_pairs(agent.autocomplete(session.prefix))
+    if as_pairs(answer) != expected:
+        failures.append(f"prefix '{session.prefix}': session {as_pairs(answer)}, autocomplete {expected}")
+    return 1
+
+
+def check_small(approach, failures):
+    """
+    a session typing 'za' while every word before it is deleted between the two letters
+    """
+    agent = make_dictionary(approach)
+    agent.build_dictionary([WordFrequency(word, frequency) for frequency, word in
+                            enumerate(['b', 'c', 'd', 'e', 'za', 'zb'], 1)])
+    session = open_session(agent)
+    checks = check(agent, session, session.push('z'), failures)
+    for word in ['b', 'c', 'd']:
+        agent.delete_word(word)
+    checks += check(agent, session, session.push('a'), failures)
+    checks += check(agent, session, session.pop(), failures)
+    agent.add_word_frequency(WordFrequency('zc', 100))
+    checks += check(agent, session, session.pop(), failures)
+    checks += check(agent, session, session.push('zc'), failures)
+    return checks
+
+
+def check_data_file(approach, words, frequencies, failures):
+    """
+    type and erase words from the data file with sessions open while words are deleted and added
+    """
+    agent = make_dictionary(approach)
+    build_from_columns(agent, words, frequencies)
+    stored = dict(zip(words, frequencies))
+    random.seed(0)
+    sessions = [open_session(agent) for _ in range(3)]
+    checks = 0
+    for _ in range(CHANGES):
+        for session in sessions:
+            typed = random.choice(words)
+            checks += check(agent, session, session.pop(len(session.prefix)), failures)
+            for letter in typed[:random.randint(1, 4)]:
+                checks += check(agent, session, session.push(letter), failures)
+
+        # deleting a tenth of the words and adding back as many, with the sessions still open
+        deleted = random.sample(sorted(stored), len(stored) // 10)
+        for word in deleted:
+            agent.delete_word(word)
+        for session in sessions:
+            checks += check(agent, session, session.pop(), failures)
+        for word in deleted:
+            if random.random() < 0.5:
+                del stored[word]
+            else:
+                agent.add_word_frequency(WordFrequency(word, stored[word]))
+        for session in sessions:
+            checks += check(agent, session, session.push(random.choice('aeiost')), failures)
+    return checks
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 3:
+        print('Incorrect number of arguments.')
+        usage()
+    if make_dictionary(args[1]) == None:
+        print('Incorrect argument value.')
+        usage()
+
+    try:
+        words, frequencies = read_columns(args[2])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    failures = []
+    checks = check_small(args[1], failures) + check_data_file(args[1], words, frequencies, failures)
+    for failure in failures[:10]:
+        print(failure)
+    print(f'{args[1]}: passed {checks - len(failures)} out of {checks}')
+    sys.exit(1 if failures else 0)
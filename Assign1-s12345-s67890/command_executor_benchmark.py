@@ -0,0 +1,127 @@
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.command_executor import run_commands
+
+
+# -------------------------------------------------------------------
+# Replays a generated command file (searches, autocompletes, adds and
+# deletes of words from the data file) on hashtable, whose operations are
+# cheap enough for the command loop to show, with the if/elif loop that
+# dictionary_file_based.py used to run and with the command executor,
+# and checks that both write the same output. Each runner keeps its best
+# time of REPEATS replays.
+#
+# python3 command_executor_benchmark.py [data fileName] [number of commands]
+# -------------------------------------------------------------------
+
+REPEATS = 3
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 command_executor_benchmark.py', '[data fileName] [number of commands]')
+    sys.exit(1)
+
+
+def make_commands(words, count):
+    lines = []
+    for _ in range(count):
+        word = random.choice(words)
+        command = random.choice(['S', 'S', 'AC', 'AC', 'A', 'D'])
+        if command == 'A':
+            lines.append(f'A {word} {random.randint(1, 1000)}\n')
+        elif command == 'AC':
+            lines.append(f'AC {word[:random.randint(1, 3)]}\n')
+        else:
+            lines.append(f'{command} {word}\n')
+    return lines
+
+
+def if_elif_loop(agent, command_file, output_file):
+    for line in command_file:
+        command_values = line.split()
+        command = command_values[0]
+        if command == 'S':
+            word = command_values[1]
+            search_result = agent.search(word)
+            if search_result > 0:
+                output_file.write(f"Found '{word}' with frequency {search_result}\n")
+            else:
+                output_file.write(f"NOT Found '{word}'\n")
+        elif command == 'A':
+            word = command_values[1]
+            frequency = int(command_values[2])
+            if not agent.add_word_frequency(WordFrequency(word, frequency)):
+                output_file.write(f"Add '{word}' failed\n")
+            else:
+                output_file.write(f"Add '{word}' succeeded\n")
+        elif command == 'D':
+            word = command_values[1]
+            if not agent.delete_word(word):
+                output_file.write(f"Delete '{word}' failed\n")
+            else:
+                output_file.write(f"Delete '{word}' succeeded\n")
+        elif command == 'AC':
+            word = command_values[1]
+            list_words = agent.autocomplete(word)
+            line = "Autocomplete for '" + word + "': [ "
+            for item in list_words:
+                line = line + item.word + ": " + str(item.frequency) + "  "
+            output_file.write(line + ']\n')
+
+
+def replay(run, data_columns, command_filename, output_filename):
+    times = []
+    for _ in range(REPEATS):
+        agent = HashTableDictionary()
+        build_from_columns(agent, *data_columns)
+        initial_time = timeit.default_timer()
+        with open(command_filename, 'r') as command_file, open(output_filename, 'w') as output_file:
+            run(agent, command_file, output_file)
+        times.append(timeit.default_timer() - initial_time)
+    return min(times)
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 3:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        data_columns = read_columns(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+    command_count = int(args[2])
+
+    work_dir = tempfile.mkdtemp()
+    command_filename = os.path.join(work_dir, 'commands.in')
+    with open(command_filename, 'w') as command_file:
+        command_file.writelines(make_commands(data_columns[0], command_count))
+
+    loop_output = os.path.join(work_dir, 'loop.out')
+    executor_output = os.path.join(work_dir, 'executor.out')
+    loop_time = replay(if_elif_loop, data_columns, command_filename, loop_output)
+    executor_time = replay(run_commands, data_columns, command_filename, executor_output)
+    with open(loop_output, 'rb') as loop_file, open(executor_output, 'rb') as executor_file:
+        assert loop_file.read() == executor_file.read(), 'the outputs differ'
+
+    for title in ['Runner', 'Time (s)', 'Commands/s']:
+        print(title.ljust(25), end='')
+    print()
+    for runner, elapsed in [('if/elif loop', loop_time), ('command executor', executor_time)]:
+        print(runner.ljust(25) + format(elapsed, '5f').ljust(25) + format(command_count / elapsed, '.0f'))
+
+    for filename in [command_filename, loop_output, executor_output]:
+        os.remove(filename)
+    os.rmdir(work_dir)
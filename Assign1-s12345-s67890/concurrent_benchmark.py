@@ -0,0 +1,106 @@
+import random
+import sys
+import threading
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.approaches import make_dictionary
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.concurrent_dictionary import ConcurrentDictionary
+
+
+# -------------------------------------------------------------------
+# Runs a number of reader threads (searches and autocompletes of words
+# from the data file) against a ConcurrentDictionary for a fixed time,
+# alone and then with a writer thread adding and deleting words as fast
+# as it can, and reports the read and write throughput, the p99 read
+# latency and the longest write with the read-write lock and in snapshot
+# mode.
+#
+# python3 concurrent_benchmark.py <approach> [data fileName] [number of readers] [seconds]
+# -------------------------------------------------------------------
+
+SNAPSHOT_INTERVAL = 10000 # changes between two snapshots in snapshot mode
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 concurrent_benchmark.py', '<approach> [data fileName] [number of readers] [seconds]')
+    print('<approach> = <list | sortedlist | columnarlist | hashtable | openhash | tst | arraytst | radixtst>')
+    sys.exit(1)
+
+
+def read_loop(agent, words, stop, latencies):
+    while not stop.is_set():
+        word = random.choice(words)
+        initial_time = timeit.default_timer()
+        if random.random() < 0.5:
+            agent.search(word)
+        else:
+            agent.autocomplete(word[:random.randint(1, 4)])
+        latencies.append(timeit.default_timer() - initial_time)
+
+
+def write_loop(agent, words, stop, counts):
+    # adds a new word and deletes it again, so the dictionary keeps its size
+    while not stop.is_set():
+        word = random.choice(words) + '~'
+        initial_time = timeit.default_timer()
+        agent.add_word_frequency(WordFrequency(word, random.randint(1, 1000)))
+        agent.delete_word(word)
+        counts[1] = max(counts[1], (timeit.default_timer() - initial_time) / 2)
+        counts[0] += 2
+
+
+def run(agent, words, reader_count, seconds, with_writer):
+    stop = threading.Event()
+    reader_latencies = [[] for _ in range(reader_count)]
+    write_counts = [0, 0] # writes, longest write
+    threads = [threading.Thread(target=read_loop, args=(agent, words, stop, latencies))
+               for latencies in reader_latencies]
+    if with_writer:
+        threads.append(threading.Thread(target=write_loop, args=(agent, words, stop, write_counts)))
+    for thread in threads:
+        thread.start()
+    stop.wait(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies = sorted(latency for reader in reader_latencies for latency in reader)
+    return len(latencies) / seconds, write_counts[0] / seconds, latencies[int(0.99 * (len(latencies) - 1))], \
+        write_counts[1]
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 5:
+        print('Incorrect number of arguments.')
+        usage()
+    if make_dictionary(args[1]) == None:
+        print('Incorrect argument value.')
+        usage()
+
+    try:
+        words, frequencies = read_columns(args[2])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+    reader_count = int(args[3])
+    seconds = float(args[4])
+
+    for title in ['Mode', 'Reads/s', 'Writes/s', 'p99 read (ms)', 'Max write (ms)', 'Snapshots']:
+        print(title.ljust(20), end='')
+    print()
+
+    for mode, snapshot_interval, with_writer in [('locked, no writer', 0, False), ('locked', 0, True),
+                                                 ('snapshot', SNAPSHOT_INTERVAL, True)]:
+        agent = make_dictionary(args[1])
+        build_from_columns(agent, words, frequencies)
+        concurrent_agent = ConcurrentDictionary(agent, snapshot_interval)
+        read_rate, write_rate, p99, max_write = run(concurrent_agent, words, reader_count, seconds, with_writer)
+        print(mode.ljust(20) + format(read_rate, '.0f').ljust(20) + format(write_rate, '.0f').ljust(20)
+              + format(p99 * 1000, '.3f').ljust(20) + format(max_write * 1000, '.3f').ljust(20)
+              + format(concurrent_agent.snapshots_published))
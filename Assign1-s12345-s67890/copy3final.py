@@ -40,6 +40,8 @@ def print_description(method_name, operation):
         print("\nAdding words to dictionary:")
     elif operation == "delete":
         print("\nDeleting words from dictionary:")
+    elif operation == "delete per word":
+        print("\nAmortized time per deleted word:")
     elif operation == "autocomplete":
         print("\nAutocompleted words from dictionary")
  
@@ -47,6 +49,10 @@ def print_description(method_name, operation):
         for title in [f'Words {operation}', 'Time taken']:
             print(title.ljust(25), end='')
         print()
+    elif operation == "delete per word":
+        for title in ['Words deleted', 'Unsorted', 'Ascending', 'Descending']:
+            print(title.ljust(25), end='')
+        print()
     else:
         for title in [f'Words {operation}', 'Unsorted', 'Ascending', 'Descending']:
             print(title.ljust(25), end='')
@@ -313,6 +319,13 @@ if __name__ == '__main__':
     #printing the description table for time complexities of different scenarios
     print_description(deletion_table, 'delete') 
 
+    # amortized cost: the cumulative time divided by the number of words deleted so far,
+    # tombstone compactions included
+    amortized_table = []
+    for row in deletion_table:
+        amortized_table.append([row[0]] + [time_taken / row[0] for time_taken in row[1:]])
+    print_description(amortized_table, 'delete per word')
+
 
     # Scenario 3 - static dictionary
     # Autocompleting dictionary
@@ -0,0 +1,85 @@
+import sys
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.list_dictionary import ListDictionary
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+from dictionary.data_loader import read_words_frequencies, read_columns, build_from_columns
+
+
+# -------------------------------------------------------------------
+# Compares the ways of reading a data file: the line by line loop of
+# dictionary_file_based.py, the streaming reader and the bulk column
+# reader, in lines per second, and then the time to load and build each
+# dictionary from a list of WordFrequency and from columns.
+#
+# python3 data_loader_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+REPEATS = 5
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 data_loader_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def best_time(call):
+    times = []
+    for _ in range(REPEATS):
+        initial_time = timeit.default_timer()
+        call()
+        times.append(timeit.default_timer() - initial_time)
+    return min(times)
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        line_count = len(read_data_file(args[1]))
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    for title in ['Reader', 'Time (s)', 'Lines/s', 'Speed-up']:
+        print(title.ljust(25), end='')
+    print()
+
+    loop_time = None
+    for reader, call in [('line loop', lambda: read_data_file(args[1])),
+                         ('streaming', lambda: list(read_words_frequencies(args[1]))),
+                         ('columns', lambda: read_columns(args[1]))]:
+        elapsed = best_time(call)
+        if loop_time == None:
+            loop_time = elapsed
+        print(reader.ljust(25) + format(elapsed, '5f').ljust(25) + format(line_count / elapsed, '.0f').ljust(25)
+              + format(loop_time / elapsed, '.2f'))
+    print()
+
+    for title in ['Approach', 'Line loop + build (s)', 'Columns + build (s)', 'Speed-up']:
+        print(title.ljust(25), end='')
+    print()
+
+    for approach, make in [('list', ListDictionary), ('hashtable', HashTableDictionary),
+                           ('tst', TernarySearchTreeDictionary)]:
+        loop_time = best_time(lambda: make().build_dictionary(read_data_file(args[1])))
+        columns_time = best_time(lambda: build_from_columns(make(), *read_columns(args[1])))
+        print(approach.ljust(25) + format(loop_time, '5f').ljust(25) + format(columns_time, '5f').ljust(25)
+              + format(loop_time / columns_time, '.2f'))
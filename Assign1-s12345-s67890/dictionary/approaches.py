@@ -0,0 +1,34 @@
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.list_dictionary import ListDictionary
+from dictionary.columnar_list_dictionary import ColumnarListDictionary
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.openaddressing_dictionary import OpenAddressingDictionary
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+from dictionary.arrayternarysearchtree_dictionary import ArrayTernarySearchTreeDictionary
+from dictionary.radixternarysearchtree_dictionary import RadixTernarySearchTreeDictionary
+
+
+# ------------------------------------------------------------------------
+# The approaches that the command line entry points accept, by name.
+# ------------------------------------------------------------------------
+
+APPROACHES = {
+    'list': ListDictionary,
+    'sortedlist': lambda: ListDictionary(sorted_mode=True),
+    'columnarlist': ColumnarListDictionary,
+    'hashtable': HashTableDictionary,
+    'openhash': OpenAddressingDictionary,
+    'tst': TernarySearchTreeDictionary,
+    'arraytst': ArrayTernarySearchTreeDictionary,
+    'radixtst': RadixTernarySearchTreeDictionary,
+}
+
+
+def make_dictionary(approach: str) -> BaseDictionary:
+    """
+    @param approach: name of an approach
+    @return: an empty dictionary of that approach, or None when the name is unknown
+    """
+    if approach not in APPROACHES:
+        return None
+    return APPROACHES[approach]()
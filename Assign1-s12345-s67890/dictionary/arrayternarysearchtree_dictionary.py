@@ -0,0 +1,288 @@
+import heapq
+from array import array
+from typing import Iterable, List
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+from dictionary.ternarysearchtree_dictionary import balanced_insertion_order
+from dictionary import tst_snapshot
+
+
+# ------------------------------------------------------------------------
+# Ternary Search Tree stored as a pool of nodes in parallel arrays.
+#
+# Instead of one Node object per letter, node i is described by position i
+# of each column below, and the child links are integer node IDs (-1 when
+# there is no child). A node therefore costs a few dozen bytes of array
+# storage rather than a Python object with its own __dict__.
+#
+# The columns can also be memoryviews over a mapped snapshot file (see
+# load), in which case the tree is searched straight from the mapping and
+# copied into arrays on the first add or delete.
+# ------------------------------------------------------------------------
+
+NO_NODE = -1 # child link value when there is no child
+
+
+class ArrayTernarySearchTreeDictionary(BaseDictionary):
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        """
+        create empty node columns
+        """
+        self.letters = array('I')         # code point of the letter stored at each node
+        self.frequencies = array('q')     # frequency of the word if the letter is the end of a word
+        self.end_words = array('b')       # 1 if the letter is the end of a word
+        self.lefts = array('i')           # ID of the left child, which holds a letter < the node letter
+        self.middles = array('i')         # ID of the middle child
+        self.rights = array('i')          # ID of the right child, which holds a letter > the node letter
+        self.max_frequencies = array('q') # highest frequency of any word in the subtree below the node
+        self.root = NO_NODE
+        self._mapping = None # snapshot mapping backing the columns, None once they are arrays
+
+    def _detach(self):
+        """
+        copy columns backed by a snapshot mapping into arrays so that they can be modified
+        """
+        if self._mapping == None:
+            return
+        for name, typecode in tst_snapshot.COLUMNS:
+            column = array(typecode)
+            column.frombytes(getattr(self, name).cast('B'))
+            setattr(self, name, column)
+        self._mapping = None
+
+    def save(self, path: str):
+        """
+        write the node table to a binary snapshot file
+        @param path: file to be written
+        """
+        tst_snapshot.save_columns(path, self.root, [getattr(self, name) for name, _ in tst_snapshot.COLUMNS])
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        map a snapshot file written by save, nothing is parsed or copied until the tree is modified
+        @param path: snapshot file
+        @return: the dictionary, searching the mapped node table
+        """
+        agent = cls()
+        agent.root, columns, agent._mapping = tst_snapshot.load_columns(path)
+        for (name, _), column in zip(tst_snapshot.COLUMNS, columns):
+            setattr(agent, name, column)
+        return agent
+
+    def _new_node(self, letter: str) -> int:
+        """
+        append a node to the pool
+        @param letter: letter stored at the node
+        @return: ID of the new node
+        """
+        self.letters.append(ord(letter))
+        self.frequencies.append(0)
+        self.end_words.append(0)
+        self.lefts.append(NO_NODE)
+        self.middles.append(NO_NODE)
+        self.rights.append(NO_NODE)
+        self.max_frequencies.append(0)
+        return len(self.letters) - 1
+
+    @property
+    def node_count(self) -> int:
+        """
+        @return: number of nodes in the pool
+        """
+        return len(self.letters)
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
+        """
+        construct the data structure to store nodes
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
+        """
+
+        self._reset()
+        for word_freq in balanced_insertion_order(words_frequencies):
+            self.add_word_frequency(word_freq)
+
+    def search(self, word: str) -> int:
+        """
+        search for a word
+        @param word: the word to be searched
+        @return: frequency > 0 if found and 0 if NOT found
+        """
+
+        node = self._find_prefix_node(word)
+        if node == NO_NODE or not self.end_words[node]:
+            return 0 # word not found in the tree
+        return self.frequencies[node]
+
+    def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
+        """
+        add a word and its frequency to the dictionary
+        @param word_frequency: (word, frequency) to be added
+        :return: True whether succeeded, False when word is already in the dictionary
+        """
+
+        word = word_frequency.word
+        word_length = len(word)
+        if word_length == 0:
+            return False
+        self._detach()
+        if self.root == NO_NODE:
+            self.root = self._new_node(word[0])
+
+        letters, lefts, middles, rights = self.letters, self.lefts, self.middles, self.rights
+        node = self.root
+        char_pos = 0 # position of current letter in the word
+        path_nodes = [] # every node visited, their subtrees will hold the new word
+        while True:
+            path_nodes.append(node)
+            letter = ord(word[char_pos])
+            node_letter = letters[node]
+            # traversing the left side of the tree
+            if letter < node_letter:
+                child = lefts[node]
+                if child == NO_NODE:
+                    child = self._new_node(word[char_pos])
+                    lefts[node] = child
+            # traversing the right side of the tree
+            elif letter > node_letter:
+                child = rights[node]
+                if child == NO_NODE:
+                    child = self._new_node(word[char_pos])
+                    rights[node] = child
+            else:
+                if char_pos == word_length - 1:
+                    break
+                char_pos += 1
+                child = middles[node]
+                if child == NO_NODE:
+                    child = self._new_node(word[char_pos])
+                    middles[node] = child
+            node = child
+
+        if self.end_words[node]:
+            return False # word already in the dictionary
+
+        frequency = word_frequency.frequency
+        self.end_words[node] = 1
+        self.frequencies[node] = frequency
+        max_frequencies = self.max_frequencies
+        for path_node in path_nodes:
+            if max_frequencies[path_node] < frequency:
+                max_frequencies[path_node] = frequency
+        return True # word and frequency added to the dictionary
+
+    def delete_word(self, word: str) -> bool:
+        """
+        delete a word from the dictionary
+        @param word: word to be deleted
+        @return: whether succeeded, e.g. return False when point not found
+        """
+
+        path_nodes = []
+        node = self._find_prefix_node(word, path_nodes)
+        if node == NO_NODE or not self.end_words[node]:
+            return False # given word not present in the dictionary
+
+        self._detach()
+        self.end_words[node] = 0
+        self.frequencies[node] = 0
+
+        # repairing the subtree frequency bounds bottom-up
+        max_frequencies = self.max_frequencies
+        for path_node in reversed(path_nodes):
+            max_frequency = self.frequencies[path_node]
+            for child in (self.lefts[path_node], self.middles[path_node], self.rights[path_node]):
+                if child != NO_NODE and max_frequencies[child] > max_frequency:
+                    max_frequency = max_frequencies[child]
+            max_frequencies[path_node] = max_frequency
+        return True # word deleted
+
+    def autocomplete(self, word: str) -> List[WordFrequency]:
+        """
+        return a list of 3 most-frequent words in the dictionary that have 'word' as a prefix
+        @param word: word to be autocompleted
+        @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'word'
+        """
+        return self.autocomplete_top_k(word, 3)
+
+    def autocomplete_top_k(self, word: str, k: int) -> List[WordFrequency]:
+        """
+        return a list of the k most-frequent words in the dictionary that have 'word' as a prefix,
+        exploring subtrees best-first by their highest frequency
+        @param word: word to be autocompleted
+        @param k: number of words wanted
+        @return: a list (could be empty) of (at most) k most-frequent words with prefix 'word'
+        """
+
+        if k <= 0:
+            return []
+
+        letters, frequencies, end_words = self.letters, self.frequencies, self.end_words
+        lefts, middles, rights, max_frequencies = self.lefts, self.middles, self.rights, self.max_frequencies
+
+        # heap entries are (-bound, 0, node, prefix) for subtrees and (-frequency, 1, word) for words,
+        # node IDs are unique so prefixes are never compared
+        heap = []
+        if word == '':
+            # every word has the empty prefix, the whole tree is searched from its root
+            if self.root != NO_NODE and max_frequencies[self.root] > 0:
+                heapq.heappush(heap, (-max_frequencies[self.root], 0, self.root, ''))
+        else:
+            node = self._find_prefix_node(word)
+            if node == NO_NODE:
+                return []
+            if end_words[node]:
+                heapq.heappush(heap, (-frequencies[node], 1, word))
+            if middles[node] != NO_NODE:
+                heapq.heappush(heap, (-max_frequencies[middles[node]], 0, middles[node], word))
+
+        word_li = []
+        while heap and len(word_li) < k:
+            entry = heapq.heappop(heap)
+            if entry[1] == 1:
+                word_li.append(WordFrequency(entry[2], -entry[0]))
+                continue
+
+            node, prefix = entry[2], entry[3]
+            node_word = prefix + chr(letters[node])
+            if end_words[node]:
+                heapq.heappush(heap, (-frequencies[node], 1, node_word))
+            for child, child_prefix in ((lefts[node], prefix), (middles[node], node_word), (rights[node], prefix)):
+                if child != NO_NODE and max_frequencies[child] > 0:
+                    heapq.heappush(heap, (-max_frequencies[child], 0, child, child_prefix))
+
+        return word_li
+
+    def _find_prefix_node(self, word: str, path_nodes: list = None) -> int:
+        """
+        descend the tree along a prefix
+        @param word: the prefix to be followed
+        @param path_nodes: optional list receiving every node visited
+        @return: ID of the node holding the last letter of 'word', or NO_NODE when no word has this prefix
+        """
+
+        letters, lefts, middles, rights = self.letters, self.lefts, self.middles, self.rights
+        node = self.root
+        word_length = len(word)
+        if word_length == 0:
+            return NO_NODE
+        i = 0
+        while node != NO_NODE:
+            if path_nodes is not None:
+                path_nodes.append(node)
+            letter = ord(word[i])
+            node_letter = letters[node]
+            if letter < node_letter:
+                node = lefts[node]
+            elif letter > node_letter:
+                node = rights[node]
+            else:
+                i += 1
+                if i == word_length:
+                    return node
+                node = middles[node]
+        return NO_NODE
@@ -0,0 +1,87 @@
+from typing import List
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+
+
+# ------------------------------------------------------------------------
+# Keystroke sessions for autocomplete.
+#
+# A session follows a prefix being typed: push adds letters, pop removes
+# them (backspace), and both return the autocomplete of the new prefix.
+# Backends that can resume from the state of the previous prefix provide
+# their own session through an autocomplete_session method; the generic
+# session below just calls autocomplete on the whole prefix every time.
+# A session stays open while the dictionary changes: push, pop and
+# results first call _refresh, which rebuilds the state of a resuming
+# session from the current prefix when the dictionary has changed.
+# ------------------------------------------------------------------------
+
+class AutocompleteSession:
+
+    def __init__(self, dictionary: BaseDictionary):
+        """
+        @param dictionary: the dictionary to be autocompleted from
+        """
+        self.dictionary = dictionary
+        self.prefix = ''
+
+    def push(self, letters: str) -> List[WordFrequency]:
+        """
+        extend the prefix
+        @param letters: letters typed, usually one
+        @return: a list (could be empty) of (at most) 3 most-frequent words with the new prefix
+        """
+        self._refresh()
+        for letter in letters:
+            self.prefix += letter
+            self._push_letter(letter)
+        return self.results()
+
+    def pop(self, count: int = 1) -> List[WordFrequency]:
+        """
+        remove letters from the end of the prefix
+        @param count: number of letters removed, at most the length of the prefix
+        @return: a list (could be empty) of (at most) 3 most-frequent words with the new prefix
+        """
+        self._refresh()
+        count = min(count, len(self.prefix))
+        for _ in range(count):
+            self._pop_letter()
+        self.prefix = self.prefix[:len(self.prefix) - count]
+        return self.results()
+
+    def results(self) -> List[WordFrequency]:
+        """
+        @return: a list (could be empty) of (at most) 3 most-frequent words with the current prefix
+        """
+        return self.dictionary.autocomplete(self.prefix)
+
+    def _refresh(self):
+        """
+        bring the session state up to date when the dictionary was changed since it was built, called
+        before any letter is pushed or popped
+        """
+        pass
+
+    def _push_letter(self, letter: str):
+        """
+        update the session state after 'letter' was appended to the prefix
+        """
+        pass
+
+    def _pop_letter(self):
+        """
+        update the session state before the last letter is removed from the prefix
+        """
+        pass
+
+
+def open_session(dictionary: BaseDictionary) -> AutocompleteSession:
+    """
+    start a keystroke session on a dictionary, with the backend's own session when it has one
+    @param dictionary: the dictionary to be autocompleted from
+    @return: a session with an empty prefix
+    """
+    if hasattr(dictionary, 'autocomplete_session'):
+        return dictionary.autocomplete_session()
+    return AutocompleteSession(dictionary)
@@ -0,0 +1,237 @@
+from typing import Iterable, List
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ------------------------------------------------------------------------
+# Columnar list-based dictionary backed by NumPy.
+#
+# Words are held UTF-8 encoded in a fixed-width byte array and frequencies
+# in an int64 array, so searches and prefix matches are vectorized scans
+# instead of Python loops, and the top k is picked with a partial
+# partition instead of a full sort. Deleted rows are masked out and squeezed away
+# once they make up half of the columns. autocomplete_many answers a whole
+# batch of prefixes against one sorted copy of the columns.
+#
+# NumPy is optional for the rest of the package, it is only required when
+# this class is instantiated.
+# ------------------------------------------------------------------------
+
+INITIAL_CAPACITY = 16
+
+
+class ColumnarListDictionary(BaseDictionary):
+
+    def __init__(self):
+        if np is None:
+            raise ImportError('ColumnarListDictionary requires numpy')
+        self._reset([], [])
+
+    def _reset(self, encoded_words: list, frequencies: list):
+        """
+        create the columns from a list of encoded words and their frequencies
+        """
+        width = max((len(encoded) for encoded in encoded_words), default=1)
+        capacity = max(INITIAL_CAPACITY, len(encoded_words))
+        self.words = np.zeros(capacity, dtype=f'S{max(width, 1)}')
+        self.frequencies = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        count = len(encoded_words)
+        self.words[:count] = encoded_words
+        self.frequencies[:count] = frequencies
+        self.alive[:count] = True
+        self.count = count      # rows in use, deleted rows included
+        self.dead_count = 0
+        self._sorted = None     # (words, frequencies) of the live rows in word order, built on demand
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
+        """
+        construct the data structure to store nodes
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
+        """
+
+        self._build((word_freq.word, word_freq.frequency) for word_freq in words_frequencies)
+
+    def build_from_columns(self, words: List[str], frequencies):
+        """
+        construct the data structure from columns, without a WordFrequency per word
+        @param words: the words to be stored
+        @param frequencies: the frequency of each word
+        """
+        self._build(zip(words, frequencies))
+
+    def _build(self, pairs):
+        """
+        @param pairs: iterable of (word, frequency) to be stored
+        """
+        # keeping the first occurrence of each word
+        unique_words = {}
+        for word, frequency in pairs:
+            unique_words.setdefault(word.encode(), frequency)
+        self._reset(list(unique_words), list(unique_words.values()))
+
+    def search(self, word: str) -> int:
+        """
+        search for a word
+        @param word: the word to be searched
+        @return: frequency > 0 if found and 0 if NOT found
+        """
+
+        row = self._find_row(word.encode())
+        if row < 0:
+            return 0 # word not found
+        return int(self.frequencies[row])
+
+    def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
+        """
+        add a word and its frequency to the dictionary
+        @param word_frequency: (word, frequency) to be added
+        :return: True whether succeeded, False when word is already in the dictionary
+        """
+
+        encoded = word_frequency.word.encode()
+        if self._find_row(encoded) >= 0:
+            return False # word already in the dictionary
+
+        if self.count == len(self.words) or len(encoded) > self.words.dtype.itemsize:
+            self._grow(len(encoded))
+        self.words[self.count] = encoded
+        self.frequencies[self.count] = word_frequency.frequency
+        self.alive[self.count] = True
+        self.count += 1
+        self._sorted = None
+        return True # word added
+
+    def delete_word(self, word: str) -> bool:
+        """
+        delete a word from the dictionary
+        @param word: word to be deleted
+        @return: whether succeeded, e.g. return False when point not found
+        """
+
+        row = self._find_row(word.encode())
+        if row < 0:
+            return False
+
+        self.alive[row] = False
+        self.dead_count += 1
+        self._sorted = None
+        if self.dead_count * 2 > self.count:
+            self._squeeze()
+        return True # word deleted
+
+    def autocomplete(self, prefix_word: str) -> List[WordFrequency]:
+        """
+        return a list of 3 most-frequent words in the dictionary that have 'prefix_word' as a prefix
+        @param prefix_word: word to be autocompleted
+        @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'prefix_word'
+        """
+        return self.autocomplete_top_k(prefix_word, 3)
+
+    def autocomplete_top_k(self, prefix_word: str, k: int) -> List[WordFrequency]:
+        """
+        return a list of the k most-frequent words in the dictionary that have 'prefix_word' as a prefix,
+        matching the prefix against every row in one vectorized pass
+        @param prefix_word: word to be autocompleted
+        @param k: number of words wanted
+        @return: a list (could be empty) of (at most) k most-frequent words with prefix 'prefix_word'
+        """
+
+        words = self.words[:self.count]
+        matches = np.char.startswith(words, prefix_word.encode()) & self.alive[:self.count]
+        rows = np.flatnonzero(matches)
+        return self._top_k(words[rows], self.frequencies[rows], k)
+
+    def autocomplete_many(self, prefix_words: List[str], k: int = 3) -> List[List[WordFrequency]]:
+        """
+        autocomplete a batch of prefixes. The live rows are sorted by word once, then the range of
+        every prefix is located with one vectorized binary search over the whole batch.
+        @param prefix_words: words to be autocompleted
+        @param k: number of words wanted for each prefix
+        @return: for each prefix, in input order, the list autocomplete_top_k would return
+        """
+
+        if self._sorted is None:
+            rows = np.flatnonzero(self.alive[:self.count])
+            order = rows[np.argsort(self.words[rows], kind='stable')]
+            self._sorted = (self.words[order], self.frequencies[order])
+        sorted_words, sorted_frequencies = self._sorted
+
+        starts, ends = [], []
+        for prefix_word in prefix_words:
+            encoded = prefix_word.encode()
+            starts.append(encoded)
+            ends.append(self._prefix_end(encoded) if encoded else encoded)
+        lows = np.searchsorted(sorted_words, np.array(starts, dtype=bytes), side='left')
+        highs = np.searchsorted(sorted_words, np.array(ends, dtype=bytes), side='left')
+
+        results = []
+        for prefix_word, low, high in zip(prefix_words, lows, highs):
+            if prefix_word == '':
+                low, high = 0, len(sorted_words)
+            results.append(self._top_k(sorted_words[low:high], sorted_frequencies[low:high], k))
+        return results
+
+    @staticmethod
+    def _prefix_end(encoded: bytes) -> bytes:
+        """
+        @param encoded: a non-empty encoded prefix, UTF-8 never has a 0xff byte to overflow
+        @return: the smallest byte string greater than every word starting with 'encoded'
+        """
+        return encoded[:-1] + bytes([encoded[-1] + 1])
+
+    @staticmethod
+    def _top_k(words, frequencies, k: int) -> List[WordFrequency]:
+        """
+        pick the k most frequent of the given rows, ties broken alphabetically
+        @param words: encoded words of the candidate rows
+        @param frequencies: frequencies of the candidate rows
+        @param k: number of words wanted
+        @return: the words as a list of WordFrequency, most frequent first
+        """
+        if k <= 0 or len(words) == 0:
+            return []
+        if len(words) > k:
+            # every row tied with the k-th frequency is kept so that ties are settled by word
+            threshold = -np.partition(-frequencies, k - 1)[k - 1]
+            keep = np.flatnonzero(frequencies >= threshold)
+            words, frequencies = words[keep], frequencies[keep]
+        order = np.lexsort((words, -frequencies))[:k]
+        return [WordFrequency(words[row].decode(), int(frequencies[row])) for row in order]
+
+    def _find_row(self, encoded: bytes) -> int:
+        """
+        @param encoded: the encoded word to be found
+        @return: the live row holding the word, or -1
+        """
+        if len(encoded) > self.words.dtype.itemsize:
+            return -1 # longer than every stored word
+        rows = np.flatnonzero((self.words[:self.count] == encoded) & self.alive[:self.count])
+        return int(rows[0]) if len(rows) > 0 else -1
+
+    def _grow(self, word_length: int):
+        """
+        double the capacity of the columns if they are full and widen the words if needed
+        @param word_length: length of the encoded word about to be added
+        """
+        capacity = len(self.words) * 2 if self.count == len(self.words) else len(self.words)
+        width = max(self.words.dtype.itemsize, word_length)
+        words = np.zeros(capacity, dtype=f'S{width}')
+        words[:self.count] = self.words[:self.count]
+        frequencies = np.zeros(capacity, dtype=np.int64)
+        frequencies[:self.count] = self.frequencies[:self.count]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self.count] = self.alive[:self.count]
+        self.words, self.frequencies, self.alive = words, frequencies, alive
+
+    def _squeeze(self):
+        """
+        drop the deleted rows
+        """
+        rows = np.flatnonzero(self.alive[:self.count])
+        self._reset(list(self.words[rows]), list(self.frequencies[rows]))
@@ -0,0 +1,174 @@
+from typing import Iterable, Iterator, List, TextIO, Tuple
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+
+
+# ------------------------------------------------------------------------
+# Command executor for command files.
+#
+# run_commands runs a command file: each line is dispatched inline on its
+# command, with the dictionary methods bound once, and the output lines are
+# collected in a buffer and written in large joined blocks, so a long
+# command file costs one write per block instead of one per command. The
+# output is the same as the one-write-per-command loop it replaces.
+#
+# The parallel executor and the server, which look at a command before
+# running it, tokenize the lines into (opcode, word, argument) tuples and
+# execute them through a table of handlers, one per opcode, each returning
+# the output line of its command. Both build the lines with the format_*
+# functions, the only definition of the output of each command.
+# ------------------------------------------------------------------------
+
+SEARCH, ADD, DELETE, AUTOCOMPLETE, UPDATE, UNKNOWN = range(6)
+OPCODES = {'S': SEARCH, 'A': ADD, 'D': DELETE, 'AC': AUTOCOMPLETE, 'U': UPDATE}
+FLUSH_SIZE = 4096 # output lines buffered before they are written
+
+
+def tokenize(lines: Iterable[str]) -> Iterator[Tuple[int, str, object]]:
+    """
+    turn command lines into an opcode stream, blank lines skipped
+    @param lines: command lines, e.g. an open command file
+    @return: a generator of (opcode, word, argument): the argument is the frequency of A and the delta of U,
+    and for an unknown command the word is the whole line
+    """
+    opcodes = OPCODES
+    for line in lines:
+        command_values = line.split()
+        if not command_values:
+            continue
+        opcode = opcodes.get(command_values[0], UNKNOWN)
+        if opcode == ADD or opcode == UPDATE:
+            yield opcode, command_values[1], int(command_values[2])
+        elif opcode == UNKNOWN:
+            yield opcode, line, None
+        else:
+            yield opcode, command_values[1], None
+
+
+def update_frequency(agent: BaseDictionary, word: str, delta: int) -> bool:
+    """
+    change the frequency of a word by 'delta', deleting it when the frequency drops to 0 or below.
+    The dictionaries without their own update_frequency go through a delete and an add.
+    @return: whether succeeded, e.g. return False when word not found
+    """
+    if hasattr(agent, 'update_frequency'):
+        return agent.update_frequency(word, delta)
+    frequency = agent.search(word)
+    if frequency == 0:
+        return False
+    agent.delete_word(word)
+    if frequency + delta > 0:
+        agent.add_word_frequency(WordFrequency(word, frequency + delta))
+    return True
+
+
+def format_search(word: str, frequency: int) -> str:
+    """
+    @return: the output line of a search command, 'frequency' being 0 when the word was not found
+    """
+    if frequency > 0:
+        return f"Found '{word}' with frequency {frequency}\n"
+    return f"NOT Found '{word}'\n"
+
+
+def format_change(operation: str, word: str, succeeded: bool) -> str:
+    """
+    @param operation: 'Add', 'Delete' or 'Update'
+    @return: the output line of a command changing the dictionary
+    """
+    if succeeded:
+        return f"{operation} '{word}' succeeded\n"
+    return f"{operation} '{word}' failed\n"
+
+
+def format_autocomplete(word: str, list_words: List[WordFrequency]) -> str:
+    """
+    @return: the output line of an autocomplete command
+    """
+    return "Autocomplete for '" + word + "': [ " + ''.join(
+        [item.word + ": " + str(item.frequency) + "  " for item in list_words]) + ']\n'
+
+
+def _search(agent: BaseDictionary, word: str, argument) -> str:
+    return format_search(word, agent.search(word))
+
+
+def _add(agent: BaseDictionary, word: str, frequency: int) -> str:
+    return format_change('Add', word, agent.add_word_frequency(WordFrequency(word, frequency)))
+
+
+def _delete(agent: BaseDictionary, word: str, argument) -> str:
+    return format_change('Delete', word, agent.delete_word(word))
+
+
+def _autocomplete(agent: BaseDictionary, word: str, argument) -> str:
+    return format_autocomplete(word, agent.autocomplete(word))
+
+
+def _update(agent: BaseDictionary, word: str, delta: int) -> str:
+    return format_change('Update', word, update_frequency(agent, word, delta))
+
+
+def _unknown(agent: BaseDictionary, line: str, argument) -> str:
+    print('Unknown command.')
+    print(line)
+    return ''
+
+
+HANDLERS = [_search, _add, _delete, _autocomplete, _update, _unknown] # indexed by opcode
+
+
+def execute(agent: BaseDictionary, command: Tuple[int, str, object]) -> str:
+    """
+    run one tokenized command
+    @param agent: the dictionary the command runs on
+    @param command: (opcode, word, argument) from tokenize
+    @return: the output line of the command, empty for an unknown command
+    """
+    opcode, word, argument = command
+    return HANDLERS[opcode](agent, word, argument)
+
+
+def run_commands(agent: BaseDictionary, command_lines: Iterable[str], output_file: TextIO,
+                 flush_size: int = FLUSH_SIZE):
+    """
+    run command lines in order and write their output in blocks
+    @param agent: the dictionary the commands run on
+    @param command_lines: command lines, e.g. an open command file, blank lines skipped
+    @param output_file: where the output lines are written
+    @param flush_size: number of output lines buffered before they are written
+    """
+    # dispatched inline on the command, with the methods bound once, which is cheaper per command
+    # than a tokenized tuple and a handler call
+    search = agent.search
+    add_word_frequency = agent.add_word_frequency
+    delete_word = agent.delete_word
+    autocomplete = agent.autocomplete
+    buffer = []
+    append = buffer.append
+    for line in command_lines:
+        command_values = line.split()
+        if not command_values:
+            continue
+        command = command_values[0]
+        if command == 'S':
+            word = command_values[1]
+            append(format_search(word, search(word)))
+        elif command == 'AC':
+            word = command_values[1]
+            append(format_autocomplete(word, autocomplete(word)))
+        elif command == 'A':
+            word = command_values[1]
+            append(format_change('Add', word, add_word_frequency(WordFrequency(word, int(command_values[2])))))
+        elif command == 'D':
+            word = command_values[1]
+            append(format_change('Delete', word, delete_word(word)))
+        elif command == 'U':
+            append(_update(agent, command_values[1], int(command_values[2])))
+        else:
+            _unknown(agent, line, None)
+            continue
+        if len(buffer) >= flush_size:
+            output_file.write(''.join(buffer))
+            buffer.clear()
+    output_file.write(''.join(buffer))
@@ -0,0 +1,96 @@
+import asyncio
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.command_executor import UNKNOWN, tokenize, execute
+
+
+# ------------------------------------------------------------------------
+# asyncio server for the command line protocol.
+#
+# Clients send the commands of a command file (S, A, D, U, AC), one per
+# line, and get back the line a command file run would write for each.
+# A connection may send many commands without waiting for the answers:
+# everything received so far is executed in order and the answers are
+# written back together. Commands run one at a time on the event loop, so
+# the dictionary needs no locking and every client sees the effect of
+# every command executed before its own. A last command without a
+# newline is answered when the client closes its side of the connection,
+# and a line longer than MAX_LINE_SIZE gets 'Line too long.' and the
+# connection is closed.
+#
+# Addresses are HOST:PORT for TCP or unix:PATH for a Unix domain socket.
+# ------------------------------------------------------------------------
+
+READ_SIZE = 1 << 16     # bytes read from a connection at a time
+MAX_LINE_SIZE = 1 << 16 # longest command line accepted, in bytes
+
+
+def answer(agent: BaseDictionary, line: str) -> str:
+    """
+    run one command line
+    @param agent: the dictionary the command runs on
+    @param line: a command line
+    @return: the answer line, empty for a blank line
+    """
+    try:
+        for command in tokenize([line]):
+            if command[0] == UNKNOWN:
+                return 'Unknown command.\n'
+            return execute(agent, command)
+    except (IndexError, ValueError):
+        return 'Incorrect command.\n' # missing word or non-numeric frequency
+    return ''
+
+
+async def _serve_connection(agent: BaseDictionary, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    answer the commands of one client until it closes the connection
+    """
+    pending = b'' # start of a line whose end has not arrived yet
+    try:
+        while True:
+            data = await reader.read(READ_SIZE)
+            if not data:
+                writer.write(answer(agent, pending.decode(errors='replace')).encode())
+                await writer.drain()
+                break
+            lines = (pending + data).split(b'\n')
+            pending = lines.pop()
+            answers = ''.join([answer(agent, line.decode(errors='replace')) for line in lines])
+            if len(pending) > MAX_LINE_SIZE:
+                writer.write((answers + 'Line too long.\n').encode())
+                await writer.drain()
+                break
+            writer.write(answers.encode())
+            await writer.drain()
+    except ConnectionError:
+        pass # client went away
+    finally:
+        writer.close()
+
+
+async def start_server(agent: BaseDictionary, address: str) -> asyncio.AbstractServer:
+    """
+    start serving a dictionary
+    @param agent: the dictionary, already built
+    @param address: HOST:PORT or unix:PATH
+    @return: the listening server
+    """
+    def handle(reader, writer):
+        return _serve_connection(agent, reader, writer)
+
+    if address.startswith('unix:'):
+        return await asyncio.start_unix_server(handle, path=address[len('unix:'):])
+    host, port = address.rsplit(':', 1)
+    return await asyncio.start_server(handle, host=host, port=int(port))
+
+
+async def open_connection(address: str):
+    """
+    connect to a server
+    @param address: HOST:PORT or unix:PATH
+    @return: (reader, writer) of the connection
+    """
+    if address.startswith('unix:'):
+        return await asyncio.open_unix_connection(path=address[len('unix:'):])
+    host, port = address.rsplit(':', 1)
+    return await asyncio.open_connection(host=host, port=int(port))
@@ -0,0 +1,250 @@
+import pickle
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterable, List
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+from dictionary.sharded_dictionary import apply_operation
+
+
+# ------------------------------------------------------------------------
+# Thread-safe wrapper around any dictionary.
+#
+# None of the dictionaries can be searched from one thread while another
+# one adds or deletes words. The wrapper guards them with a read-write
+# lock: any number of threads may search and autocomplete at the same
+# time, a thread changing the dictionary waits until they are done and
+# has it to itself. Writers go first once they are waiting, so a steady
+# stream of readers cannot hold them off.
+#
+# In snapshot mode readers never wait for a change. The changes go to the
+# dictionary itself under a lock that only writers take, and are logged
+# for two replicas of it. Readers use the published replica. The other
+# one (the standby) is caught up with the log a few changes per write,
+# once the readers that started before it was swapped out are done, and
+# it is swapped in after 'snapshot_interval' changes if it has caught up.
+# Nothing is copied after the replicas are made and no write replays more
+# than a few changes: a change is applied three times instead, and a
+# reader may not see the latest changes until the next swap.
+# ------------------------------------------------------------------------
+
+REPLAYED_PER_CHANGE = 2 # pending changes replayed on the standby by each change, it catches up at twice the rate
+
+
+class ReadWriteLock:
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.readers = 0 # threads holding the lock for reading
+        self.writer_active = False
+        self.waiting_writers = 0
+
+    def acquire_read(self):
+        with self.condition:
+            while self.writer_active or self.waiting_writers > 0:
+                self.condition.wait()
+            self.readers += 1
+
+    def release_read(self):
+        with self.condition:
+            self.readers -= 1
+            if self.readers == 0:
+                self.condition.notify_all()
+
+    def acquire_write(self):
+        with self.condition:
+            self.waiting_writers += 1
+            while self.writer_active or self.readers > 0:
+                self.condition.wait()
+            self.waiting_writers -= 1
+            self.writer_active = True
+
+    def release_write(self):
+        with self.condition:
+            self.writer_active = False
+            self.condition.notify_all()
+
+    @contextmanager
+    def reading(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class Replica:
+    """
+    a copy of the dictionary served to the readers in snapshot mode
+    """
+
+    def __init__(self, dictionary: BaseDictionary):
+        self.dictionary = dictionary
+        self.readers = 0       # threads reading it
+        self.pending = deque() # (operation, args) of the changes not replayed on it yet
+
+
+class ConcurrentDictionary(BaseDictionary):
+
+    def __init__(self, dictionary: BaseDictionary, snapshot_interval: int = 0,
+                 make_replica: Callable[[], BaseDictionary] = None):
+        """
+        @param dictionary: the dictionary to be shared between threads
+        @param snapshot_interval: 0 to guard every call with the read-write lock, otherwise the number of
+        changes after which they are published to the readers
+        @param make_replica: in snapshot mode, returns a dictionary with the same words as 'dictionary'.
+        By default the replicas are pickled copies, which a dictionary over a memory-mapped snapshot
+        can't be, so for one of those it should load the snapshot file again.
+        """
+        self.dictionary = dictionary
+        self.snapshot_interval = snapshot_interval
+        self.lock = ReadWriteLock()
+        self.snapshots_published = 0
+        if snapshot_interval > 0:
+            self.write_lock = threading.Lock()
+            self.replicas_lock = threading.Condition() # guards the reader counts and the swap
+            self.published, self.standby = [Replica(i) for i in self._make_replicas(make_replica)]
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
+        """
+        construct the data structure to store nodes
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
+        """
+        if self.snapshot_interval > 0:
+            # kept for the replicas to be built from too
+            self._write('build_dictionary', list(words_frequencies))
+            self.publish()
+        else:
+            self._write('build_dictionary', words_frequencies)
+
+    def search(self, word: str) -> int:
+        """
+        search for a word
+        @param word: the word to be searched
+        @return: frequency > 0 if found and 0 if NOT found
+        """
+        return self._read(lambda agent: agent.search(word))
+
+    def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
+        """
+        add a word and its frequency to the dictionary
+        @param word_frequency: (word, frequency) to be added
+        @return: True whether succeeded, False when word is already in the dictionary
+        """
+        return self._write('add_word_frequency', word_frequency)
+
+    def delete_word(self, word: str) -> bool:
+        """
+        delete a word from the dictionary
+        @param word: word to be deleted
+        @return: whether succeeded, e.g. return False when point not found
+        """
+        return self._write('delete_word', word)
+
+    def update_frequency(self, word: str, delta: int) -> bool:
+        """
+        change the frequency of a word by 'delta' as a single change, deleting it when the frequency
+        drops to 0 or below
+        @return: whether succeeded, e.g. return False when word not found
+        """
+        return self._write('update_frequency', word, delta)
+
+    def autocomplete(self, prefix_word: str) -> List[WordFrequency]:
+        """
+        return a list of 3 most-frequent words in the dictionary that have 'prefix_word' as a prefix
+        @param prefix_word: word to be autocompleted
+        @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'prefix_word'
+        """
+        return self._read(lambda agent: agent.autocomplete(prefix_word))
+
+    def publish(self):
+        """
+        in snapshot mode, make every change so far visible to the readers, waiting for the readers
+        of the standby replica to finish when there are any
+        """
+        while True:
+            with self.write_lock:
+                if not self.published.pending:
+                    return
+                if self._replay(len(self.standby.pending)):
+                    self._swap_replicas()
+                    return
+            with self.replicas_lock:
+                while self.standby.readers > 0:
+                    self.replicas_lock.wait()
+
+    def _read(self, operation):
+        if self.snapshot_interval == 0:
+            with self.lock.reading():
+                return operation(self.dictionary)
+
+        with self.replicas_lock:
+            replica = self.published
+            replica.readers += 1
+        try:
+            return operation(replica.dictionary)
+        finally:
+            with self.replicas_lock:
+                replica.readers -= 1
+                if replica.readers == 0:
+                    self.replicas_lock.notify_all()
+
+    def _write(self, operation: str, *args):
+        if self.snapshot_interval == 0:
+            with self.lock.writing():
+                return apply_operation(self.dictionary, operation, args)
+
+        with self.write_lock:
+            result = apply_operation(self.dictionary, operation, args)
+            if result != False: # a failed add, delete or update changed nothing
+                self.published.pending.append((operation, args))
+                self.standby.pending.append((operation, args))
+            if self._replay(REPLAYED_PER_CHANGE) and len(self.published.pending) >= self.snapshot_interval:
+                self._swap_replicas()
+            return result
+
+    def _replay(self, count: int) -> bool:
+        """
+        replay pending changes on the standby replica, called holding the write lock
+        @param count: largest number of changes replayed
+        @return: whether the standby is up to date, False when it still has readers or pending changes
+        """
+        with self.replicas_lock:
+            if self.standby.readers > 0:
+                return False # tried again after the next change
+        # no reader can reach the standby until it is published
+        standby = self.standby
+        for _ in range(min(count, len(standby.pending))):
+            operation, args = standby.pending.popleft()
+            apply_operation(standby.dictionary, operation, args)
+        return not standby.pending
+
+    def _swap_replicas(self):
+        """
+        publish the standby replica once it is up to date, called holding the write lock
+        """
+        with self.replicas_lock:
+            self.published, self.standby = self.standby, self.published
+        self.snapshots_published += 1
+
+    def _make_replicas(self, make_replica) -> list:
+        """
+        @return: two dictionaries with the same words as the wrapped one
+        """
+        if make_replica != None:
+            return [make_replica(), make_replica()]
+        try:
+            data = pickle.dumps(self.dictionary, pickle.HIGHEST_PROTOCOL)
+        except (TypeError, pickle.PicklingError, RecursionError) as e:
+            raise ValueError(f'{type(self.dictionary).__name__} cannot be copied for snapshot mode, '
+                             f'pass make_replica') from e
+        return [pickle.loads(data), pickle.loads(data)]
@@ -0,0 +1,98 @@
+from array import array
+from typing import Iterator, List, Tuple
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+
+
+# ------------------------------------------------------------------------
+# Readers for data files.
+#
+# The file is read in large binary blocks cut at the last newline. Each
+# block is decoded and split on whitespace in one call, and its
+# frequencies are converted in one pass into an array, which gives the
+# words and frequencies of the block as two columns without a Python loop
+# per line. read_words_frequencies streams the rows block by block, so a
+# dictionary built from it never holds the whole file, while read_columns
+# returns whole columns for build_from_columns.
+# ------------------------------------------------------------------------
+
+BLOCK_SIZE = 1 << 20 # bytes read at a time
+
+
+def read_column_blocks(data_filename: str, block_size: int = BLOCK_SIZE) -> Iterator[Tuple[List[str], array]]:
+    """
+    parse a data file a block of whole lines at a time, one line per word and its frequency
+    @param data_filename: the data file, opened on the first block asked for
+    @param block_size: bytes read at a time
+    @return: a generator of (words, frequencies) for successive blocks, in file order
+    """
+    with open(data_filename, 'rb') as data_file:
+        remainder = b''
+        while True:
+            block = data_file.read(block_size)
+            if not block:
+                break
+            block = remainder + block
+            # a UTF-8 newline byte is never part of another character, so the cut is safe
+            end = block.rfind(b'\n') + 1
+            remainder = block[end:]
+            if end > 0:
+                yield _parse_block(block[:end])
+        if remainder:
+            yield _parse_block(remainder)
+
+
+def _parse_block(block: bytes) -> Tuple[List[str], array]:
+    """
+    @param block: whole lines of a data file
+    @return: the words and frequencies of the block
+    """
+    tokens = block.decode().split()
+    line_count = block.count(b'\n') + (0 if block.endswith(b'\n') else 1)
+    if len(tokens) != 2 * line_count:
+        # blank lines or extra fields, going line by line
+        tokens = []
+        for line in block.decode().splitlines():
+            values = line.split()
+            if values:
+                tokens += [values[0], values[1]]
+    return tokens[0::2], array('q', map(int, tokens[1::2]))
+
+
+def read_words_frequencies(data_filename: str, block_size: int = BLOCK_SIZE) -> Iterator[WordFrequency]:
+    """
+    parse a data file lazily, blank lines skipped
+    @param data_filename: the data file, opened on the first item asked for
+    @param block_size: bytes read at a time
+    @return: a generator of (word, frequency) in file order
+    """
+    for words, frequencies in read_column_blocks(data_filename, block_size):
+        yield from map(WordFrequency, words, frequencies)
+
+
+def read_columns(data_filename: str, block_size: int = BLOCK_SIZE) -> Tuple[List[str], array]:
+    """
+    parse a whole data file into columns
+    @param data_filename: the data file
+    @param block_size: bytes read at a time
+    @return: (words, frequencies) of every line, in file order
+    """
+    words, frequencies = [], array('q')
+    for block_words, block_frequencies in read_column_blocks(data_filename, block_size):
+        words += block_words
+        frequencies += block_frequencies
+    return words, frequencies
+
+
+def build_from_columns(dictionary: BaseDictionary, words: List[str], frequencies):
+    """
+    build a dictionary from columns, through the dictionary's own build_from_columns when it has one
+    and as WordFrequency rows otherwise
+    @param dictionary: the dictionary to be built
+    @param words: the words, duplicates handled as build_dictionary does
+    @param frequencies: the frequency of each word
+    """
+    if hasattr(dictionary, 'build_from_columns'):
+        dictionary.build_from_columns(words, frequencies)
+    else:
+        dictionary.build_dictionary(map(WordFrequency, words, frequencies))
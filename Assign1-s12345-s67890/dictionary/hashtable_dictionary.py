@@ -1,4 +1,6 @@
-from typing import List
+import heapq
+from bisect import bisect_left, insort
+from typing import Iterable, List
 from dictionary.base_dictionary import BaseDictionary
 from dictionary.word_frequency import WordFrequency
 
@@ -10,18 +12,59 @@ from dictionary.word_frequency import WordFrequency
 # __copyright__ = 'Copyright 2022, RMIT University'
 # ------------------------------------------------------------------------
 
+TOP_K = 3 # number of words returned by autocomplete
+
+
+def _rank(word_freq):
+    """
+    sort key for (word, frequency) pairs: most frequent first, ties broken alphabetically
+    """
+    return -word_freq[1], word_freq[0]
+
+
 class HashTableDictionary(BaseDictionary):
 
-    def build_dictionary(self, words_frequencies: List[WordFrequency]):
+    def __init__(self, prefix_index_length: int = 3):
+        """
+        @param prefix_index_length: prefixes up to this length get an autocomplete bucket, 0 disables the index
+        """
+        self.prefix_index_length = prefix_index_length
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
         """
         construct the data structure to store nodes
-        @param words_frequencies: list of (word, frequency) to be stored
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
         """
 
         self.dict={} # creating an empty dictionary
         for i in words_frequencies:
             self.dict.update({i.word:i.frequency})
+        self._build_index()
 
+    def build_from_columns(self, words: List[str], frequencies):
+        """
+        construct the data structure from columns, without a WordFrequency per word
+        @param words: the words to be stored
+        @param frequencies: the frequency of each word
+        """
+
+        self.dict = dict(zip(words, frequencies))
+        self._build_index()
+
+    def _build_index(self):
+        """
+        index every word of the table under its prefixes
+        """
+        # secondary index: for each prefix up to prefix_index_length, the (-frequency, word) key of every
+        # word with that prefix, sorted so that the most frequent come first. A word's key is one tuple
+        # shared by all of its buckets.
+        self.prefix_buckets = {}
+        for word, frequency in self.dict.items():
+            key = (-frequency, word)
+            for prefix in self._indexed_prefixes(word):
+                self.prefix_buckets.setdefault(prefix, []).append(key)
+        for bucket in self.prefix_buckets.values():
+            bucket.sort()
 
     def search(self, word: str) -> int:
         """
@@ -30,11 +73,7 @@ class HashTableDictionary(BaseDictionary):
         @return: frequency > 0 if found and 0 if NOT found
         """
 
-        for keys in self.dict.keys():
-            if keys == word:             
-                return self.dict[keys]
-
-        return 0
+        return self.dict.get(word, 0)
 
     def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
         """
@@ -43,12 +82,12 @@ class HashTableDictionary(BaseDictionary):
         :return: True whether succeeded, False when word is already in the dictionary
         """
         
-        for i in self.dict.keys():
-            if i!=word_frequency.word:
-                self.dict[word_frequency.word]=word_frequency.frequency
-                return True # word added is not already in the dictionary
+        if word_frequency.word in self.dict:
+            return False # word already in the dictionary
 
-        return False
+        self.dict[word_frequency.word]=word_frequency.frequency
+        self._index(word_frequency.word, word_frequency.frequency)
+        return True # word added is not already in the dictionary
 
     def delete_word(self, word: str) -> bool:
         """
@@ -57,12 +96,40 @@ class HashTableDictionary(BaseDictionary):
         @return: whether succeeded, e.g. return False when point not found
         """
         
-        for keys in self.dict.keys():
-            if keys == word:             
-                self.dict.pop(keys)
-                return True # word deleted if found in the dictionary
+        if word in self.dict:
+            self._unindex(word, self.dict.pop(word))
+            return True # word deleted if found in the dictionary
         return False
 
+    def update_frequency(self, word: str, delta: int) -> bool:
+        """
+        change the frequency of a word by 'delta', the word is deleted when its frequency drops to 0 or below.
+        The word's key is moved within each of its prefix buckets, or rewritten in place when it stays
+        between the same neighbours.
+        @param word: word to be updated
+        @param delta: amount added to the frequency, can be negative
+        @return: whether succeeded, e.g. return False when word not found
+        """
+
+        if word not in self.dict:
+            return False
+        frequency = self.dict[word] + delta
+        if frequency <= 0:
+            return self.delete_word(word)
+
+        old_key = (-self.dict[word], word)
+        self.dict[word] = frequency
+        key = (-frequency, word)
+        for prefix in self._indexed_prefixes(word):
+            bucket = self.prefix_buckets[prefix]
+            position = bisect_left(bucket, old_key)
+            if bisect_left(bucket, key) in (position, position + 1):
+                bucket[position] = key # still between the same neighbours
+            else:
+                del bucket[position]
+                insort(bucket, key)
+        return True # word updated
+
     def autocomplete(self, word: str) -> List[WordFrequency]:
         """
         return a list of 3 most-frequent words in the dictionary that have 'word' as a prefix
@@ -70,6 +137,21 @@ class HashTableDictionary(BaseDictionary):
         @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'word'
         """
 
+        if word == '':
+            # every word has the empty prefix, ranked like the indexed prefixes
+            return [WordFrequency(i, frequency) for i, frequency in heapq.nsmallest(TOP_K, self.dict.items(), key=_rank)]
+        if len(word) <= self.prefix_index_length:
+            return [WordFrequency(i, -frequency) for frequency, i in self.prefix_buckets.get(word, [])[:TOP_K]]
+        if len(word) > self.prefix_index_length > 0:
+            # only the words of the deepest indexed bucket can have this prefix, read best first
+            final_li = []
+            for frequency, i in self.prefix_buckets.get(word[:self.prefix_index_length], ()):
+                if i.startswith(word):
+                    final_li.append(WordFrequency(i, -frequency))
+                    if len(final_li) == TOP_K:
+                        break
+            return final_li
+
         prefix_dict = {}  # dictionary of all words with the given prefix
         final_li = []  # list for only top three words
 
@@ -86,3 +168,33 @@ class HashTableDictionary(BaseDictionary):
             final_li.append(x)
 
         return final_li
+
+    def _indexed_prefixes(self, word: str) -> List[str]:
+        """
+        @param word: word to be indexed
+        @return: the prefixes of the word that have a bucket
+        """
+        return [word[:length] for length in range(1, min(len(word), self.prefix_index_length) + 1)]
+
+    def _index(self, word: str, frequency: int):
+        """
+        insert a word in its prefix buckets, keeping them sorted
+        @param word: the word added
+        @param frequency: its frequency
+        """
+        key = (-frequency, word)
+        for prefix in self._indexed_prefixes(word):
+            insort(self.prefix_buckets.setdefault(prefix, []), key)
+
+    def _unindex(self, word: str, frequency: int):
+        """
+        remove a deleted word from its prefix buckets
+        @param word: the word deleted
+        @param frequency: its frequency when it was deleted
+        """
+        key = (-frequency, word)
+        for prefix in self._indexed_prefixes(word):
+            bucket = self.prefix_buckets[prefix]
+            del bucket[bisect_left(bucket, key)]
+            if not bucket:
+                del self.prefix_buckets[prefix]
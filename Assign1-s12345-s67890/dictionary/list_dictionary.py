@@ -1,6 +1,9 @@
-from typing import List
+import heapq
+from bisect import bisect_left
+from typing import Iterable, List
 from dictionary.word_frequency import WordFrequency
 from dictionary.base_dictionary import BaseDictionary
+from dictionary.autocomplete_session import AutocompleteSession
 
 
 # ------------------------------------------------------------------------
@@ -10,18 +13,72 @@ from dictionary.base_dictionary import BaseDictionary
 # __copyright__ = 'Copyright 2022, RMIT University'
 # ------------------------------------------------------------------------
 
+def _prefix_end(prefix_word: str) -> str:
+    """
+    @param prefix_word: a non-empty prefix
+    @return: the smallest string greater than every word starting with 'prefix_word'
+    """
+    return prefix_word[:-1] + chr(ord(prefix_word[-1]) + 1)
+
+
+def _frequency_key(li) -> tuple:
+    """
+    @param li: a [word, frequency] entry
+    @return: its position key in the frequency order, most frequent first and ties alphabetical
+    """
+    return -li[1], li[0]
+
+
 class ListDictionary(BaseDictionary):
 
-    def build_dictionary(self, words_frequencies: List[WordFrequency]):
+    def __init__(self, sorted_mode: bool = False, compact_ratio: float = 0.25):
+        """
+        @param sorted_mode: keep the list in lexicographic order, searched with binary search
+        @param compact_ratio: fraction of deleted entries above which delete_word compacts the list
+        """
+        self.sorted_mode = sorted_mode
+        self.compact_ratio = compact_ratio
+        self.modifications = 0 # bumped by every change to the list, open sessions restart when it moves
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
         """
         construct the data structure to store nodes
-        @param words_frequencies: list of (word, frequency) to be stored
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
+        """
+        self._build((i.word, i.frequency) for i in words_frequencies)
+
+    def build_from_columns(self, words: List[str], frequencies):
+        """
+        construct the data structure from columns, without a WordFrequency per word
+        @param words: the words to be stored
+        @param frequencies: the frequency of each word
+        """
+        self._build(zip(words, frequencies))
+
+    def _build(self, pairs):
+        """
+        @param pairs: iterable of (word, frequency) to be stored
         """
         self.dict_list = [] # creating empty list
+        self.tombstones = 0 # deleted entries are set to None until the list is compacted
+        self.modifications += 1
 
-        for i in words_frequencies:
-            li = [i.word, i.frequency]
-            self.dict_list.append(li) # adding words and their frequencies to the list
+        # keeping the first occurrence of each word
+        unique_words = {}
+        for word, frequency in pairs:
+            li = [word, frequency]
+            if unique_words.setdefault(word, li) is li:
+                self.dict_list.append(li) # adding words and their frequencies to the list
+
+        if self.sorted_mode:
+            self.dict_list.sort(key=lambda x: x[0])
+            self.words = [i[0] for i in self.dict_list] # words alone, for bisect
+
+        # secondary index: the same entries by descending frequency, with their keys alone for bisect.
+        # A deleted or moved entry leaves None in by_frequency, its key stays to keep the keys sorted.
+        self.by_frequency = sorted(self.dict_list, key=_frequency_key)
+        self.frequency_keys = [_frequency_key(i) for i in self.by_frequency]
+        self.frequency_tombstones = 0
 
 
     def search(self, word: str) -> int:
@@ -31,8 +88,14 @@ class ListDictionary(BaseDictionary):
         @return: frequency > 0 if found and 0 if NOT found
         """
 
+        if self.sorted_mode:
+            index = bisect_left(self.words, word)
+            if index < len(self.words) and self.words[index] == word and self.dict_list[index] != None:
+                return self.dict_list[index][1] # word found
+            return 0 # word not found
+
         for i in self.dict_list:
-            if i[0] == word:             
+            if i != None and i[0] == word:             
                 return i[1] # word found
 
         return 0 # word not found
@@ -44,13 +107,29 @@ class ListDictionary(BaseDictionary):
         :return: True whether succeeded, False when word is already in the dictionary
         """
         
-        for i in self.dict_list:
-            if i[0] == word_frequency.word: 
-                return False # word already in the list
+        li = [word_frequency.word, word_frequency.frequency]
+        if self.sorted_mode:
+            index = bisect_left(self.words, word_frequency.word)
+            if index < len(self.words) and self.words[index] == word_frequency.word:
+                if self.dict_list[index] != None:
+                    return False # word already in the list
+                self.dict_list[index] = li # reusing the tombstone of the word
+                self.tombstones -= 1
             else:
-                li = [word_frequency.word, word_frequency.frequency]
-                self.dict_list.append(li)
-                return True # word added
+                self.words.insert(index, word_frequency.word)
+                self.dict_list.insert(index, li)
+        else:
+            for i in self.dict_list:
+                if i != None and i[0] == word_frequency.word: 
+                    return False # word already in the list
+            self.dict_list.append(li)
+
+        key = _frequency_key(li)
+        position = bisect_left(self.frequency_keys, key)
+        self.frequency_keys.insert(position, key)
+        self.by_frequency.insert(position, li)
+        self.modifications += 1
+        return True # word added
 
 
     def delete_word(self, word: str) -> bool:
@@ -60,12 +139,65 @@ class ListDictionary(BaseDictionary):
         @return: whether succeeded, e.g. return False when point not found
         """
         
-        for i in self.dict_list:
-            if word in i:
-                self.dict_list.remove(i)
-                return True # word deleted
+        index = self._find_index(word)
+        if index < 0:
+            return False
+
+        # leaving tombstones instead of shifting the rest of the lists
+        self.by_frequency[self._frequency_position(self.dict_list[index])] = None
+        self.frequency_tombstones += 1
+        self.dict_list[index] = None
+        self.tombstones += 1
+        self.modifications += 1
+        self._compact_if_needed()
+        return True # word deleted
 
-        return False
+    def update_frequency(self, word: str, delta: int) -> bool:
+        """
+        change the frequency of a word by 'delta', the word is deleted when its frequency drops to 0 or below.
+        The entry is changed in place and only moves within the frequency index.
+        @param word: word to be updated
+        @param delta: amount added to the frequency, can be negative
+        @return: whether succeeded, e.g. return False when word not found
+        """
+
+        index = self._find_index(word)
+        if index < 0:
+            return False
+        li = self.dict_list[index]
+        if li[1] + delta <= 0:
+            return self.delete_word(word)
+
+        position = self._frequency_position(li)
+        li[1] += delta
+        key = _frequency_key(li)
+        new_position = bisect_left(self.frequency_keys, key)
+        if new_position == position or new_position == position + 1:
+            self.frequency_keys[position] = key # still between the same neighbours, it stays in its slot
+        else:
+            self.by_frequency[position] = None
+            self.frequency_tombstones += 1
+            self.frequency_keys.insert(new_position, key)
+            self.by_frequency.insert(new_position, li)
+        self.modifications += 1
+        self._compact_if_needed()
+        return True # word updated
+
+    def compact(self) -> int:
+        """
+        remove the tombstones left by deletions and updates in one pass over each list
+        @return: number of entries removed from dict_list
+        """
+        removed = self.tombstones
+        if self.sorted_mode:
+            self.words = [word for word, i in zip(self.words, self.dict_list) if i != None]
+        self.dict_list = [i for i in self.dict_list if i != None]
+        self.tombstones = 0
+        self.frequency_keys = [key for key, i in zip(self.frequency_keys, self.by_frequency) if i != None]
+        self.by_frequency = [i for i in self.by_frequency if i != None]
+        self.frequency_tombstones = 0
+        self.modifications += 1
+        return removed
 
 
     def autocomplete(self, prefix_word: str) -> List[WordFrequency]:
@@ -74,19 +206,155 @@ class ListDictionary(BaseDictionary):
         @param prefix_word: word to be autocompleted
         @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'prefix_word'
         """
-        
-        prefix_li = []  # list of all words with the given prefix
-        final_li = []  # list for only top three words
+        return self.autocomplete_top_k(prefix_word, 3)
 
-        for i in self.dict_list:
-            if i[0].startswith(prefix_word):
-                prefix_li.append(i)
+    def autocomplete_top_k(self, prefix_word: str, k: int) -> List[WordFrequency]:
+        """
+        return a list of the k most-frequent words in the dictionary that have 'prefix_word' as a prefix.
+        The entries are scanned in descending frequency, so the scan stops at the k-th match.
+        In sorted mode, when the prefix range is small enough that going through it costs less than
+        the expected frequency scan, the range is found with two binary searches and only it goes
+        through a heap of size k.
+        @param prefix_word: word to be autocompleted
+        @param k: number of words wanted
+        @return: a list (could be empty) of (at most) k most-frequent words with prefix 'prefix_word'
+        """
+
+        if k <= 0:
+            return []
+
+        if self.sorted_mode:
+            low, high = self._prefix_range(prefix_word)
+            return self._top_k_in_range(prefix_word, low, high, k)
+        return self._top_k_by_frequency(prefix_word, k)
+
+    def autocomplete_session(self) -> AutocompleteSession:
+        """
+        start a keystroke session. In sorted mode it keeps the range of every prefix typed, so that a
+        new letter is only searched for within the previous range and backspace drops the last range.
+        @return: a session with an empty prefix
+        """
+        if self.sorted_mode:
+            return SortedListSession(self)
+        return AutocompleteSession(self)
+
+    def _top_k_in_range(self, prefix_word: str, low: int, high: int, k: int) -> List[WordFrequency]:
+        """
+        @param prefix_word: prefix to be autocompleted, in sorted mode
+        @param low, high: the range of 'prefix_word' in dict_list
+        @param k: number of words wanted
+        @return: the k most-frequent words of the range, from the range itself when it is small
+        enough and from the frequency scan otherwise
+        """
+        # the frequency scan meets a match about every len / (high - low) entries
+        if (high - low) * (high - low) <= k * len(self.by_frequency):
+            prefix_li = [i for i in self.dict_list[low:high] if i != None]
+            prefix_li = heapq.nsmallest(k, prefix_li, key=_frequency_key)
+            return [WordFrequency(j[0], j[1]) for j in prefix_li]
+        return self._top_k_by_frequency(prefix_word, k)
+
+    def _top_k_by_frequency(self, prefix_word: str, k: int) -> List[WordFrequency]:
+        """
+        @return: the k most-frequent words with prefix 'prefix_word', scanning in descending frequency
+        """
+        final_li = []
+        for j in self.by_frequency:
+            if j != None and j[0].startswith(prefix_word):
+                final_li.append(WordFrequency(j[0], j[1]))
+                if len(final_li) == k:
+                    break
+        return final_li
+
+    def _frequency_position(self, li) -> int:
+        """
+        @param li: a live [word, frequency] entry
+        @return: its position in by_frequency
+        """
+        position = bisect_left(self.frequency_keys, _frequency_key(li))
+        while self.by_frequency[position] is not li:
+            position += 1 # a tombstone of the same word with the same frequency comes first
+        return position
+
+    def _compact_if_needed(self):
+        """
+        compact once either list holds too many tombstones
+        """
+        if self.tombstones > self.compact_ratio * len(self.dict_list) or \
+                self.frequency_tombstones > self.compact_ratio * len(self.by_frequency):
+            self.compact()
+
+    def _find_index(self, word: str) -> int:
+        """
+        @param word: the word to be found
+        @return: position of the live entry of the word in dict_list, or -1
+        """
+        if self.sorted_mode:
+            position = bisect_left(self.words, word)
+            if position < len(self.words) and self.words[position] == word and self.dict_list[position] != None:
+                return position
+            return -1
+
+        for position, i in enumerate(self.dict_list):
+            if i != None and i[0] == word:
+                return position
+        return -1
+
+    def _prefix_range(self, prefix_word: str):
+        """
+        @param prefix_word: prefix to be located, in sorted mode
+        @return: (low, high) such that the words with this prefix are dict_list[low:high]
+        """
+        if prefix_word == '':
+            return 0, len(self.words)
+        return bisect_left(self.words, prefix_word), bisect_left(self.words, _prefix_end(prefix_word))
+
+
+class SortedListSession(AutocompleteSession):
+
+    def __init__(self, dictionary: ListDictionary):
+        """
+        @param dictionary: the sorted mode list to be autocompleted from
+        """
+        super().__init__(dictionary)
+        self._restart()
+
+    def _restart(self):
+        """
+        find the ranges of the current prefix again, after the list was changed
+        """
+        self.modifications = self.dictionary.modifications
+        self.ranges = []  # (low, high) range in dict_list of each prefix typed
+        self.answers = [] # autocomplete of each prefix typed, None until asked for
+        prefix = self.prefix
+        self.prefix = ''
+        for letter in prefix:
+            self.prefix += letter
+            self._push_letter(letter)
+
+    def results(self) -> List[WordFrequency]:
+        """
+        @return: a list (could be empty) of (at most) 3 most-frequent words with the current prefix
+        """
+        self._refresh()
+        if not self.ranges:
+            return self.dictionary.autocomplete('')
+        if self.answers[-1] == None:
+            low, high = self.ranges[-1]
+            self.answers[-1] = self.dictionary._top_k_in_range(self.prefix, low, high, 3)
+        return list(self.answers[-1])
 
-        prefix_li = sorted(prefix_li, key=lambda x: x[1], reverse=True)     
-        prefix_li = prefix_li[0:3]
+    def _refresh(self):
+        if self.modifications != self.dictionary.modifications:
+            self._restart()
 
-        for j in prefix_li:
-            x = WordFrequency(j[0], j[1])
-            final_li.append(x)
+    def _push_letter(self, letter: str):
+        words = self.dictionary.words
+        low, high = self.ranges[-1] if self.ranges else (0, len(words))
+        low = bisect_left(words, self.prefix, low, high)
+        high = bisect_left(words, _prefix_end(self.prefix), low, high)
+        self.ranges.append((low, high))
+        self.answers.append(None)
 
-        return final_li
\ No newline at end of file
+    def _pop_letter(self):
+        self.ranges.pop()
+        self.answers.pop()
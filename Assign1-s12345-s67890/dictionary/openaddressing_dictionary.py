@@ -0,0 +1,207 @@
+import heapq
+from array import array
+from typing import Iterable, List
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+
+
+# ------------------------------------------------------------------------
+# Open-addressing hash table over flat arrays.
+#
+# Words are stored UTF-8 encoded one after the other in a byte arena and
+# described by an entry in parallel columns (arena offset, length, hash,
+# frequency). The slot table holds entry IDs and is probed linearly.
+# Deleted words leave a tombstone in their slot, which remembers the dead
+# entry: a word added in that slot takes over the entry, and its bytes in
+# the arena when the word fits there. When live entries plus tombstones
+# pass the load factor, or dead entries outnumber the live ones, the
+# table is rebuilt, which also drops dead entries and their bytes from the
+# arena.
+# ------------------------------------------------------------------------
+
+EMPTY = -1     # slot never used
+TOMBSTONE = -2 # slot of a deleted entry is TOMBSTONE - entry, probing continues past it
+MAX_LOAD = 2 / 3
+MIN_SLOTS = 8
+
+
+class OpenAddressingDictionary(BaseDictionary):
+
+    def __init__(self):
+        self._reset(MIN_SLOTS)
+
+    def _reset(self, slot_count: int):
+        """
+        create an empty table
+        @param slot_count: number of slots, a power of two
+        """
+        self.slots = array('i', [EMPTY]) * slot_count
+        self.arena = bytearray()   # encoded words, back to back
+        self.offsets = array('q')  # start of each entry's word in the arena
+        self.lengths = array('i')  # length in bytes of each entry's word, -1 once deleted
+        self.hashes = array('q')   # hash of each entry's word
+        self.frequencies = array('q')
+        self.used_slots = 0        # live entries and tombstones
+        self.live_count = 0
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
+        """
+        construct the data structure to store nodes
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
+        """
+
+        self._reset(MIN_SLOTS)
+        for word_freq in words_frequencies:
+            self.add_word_frequency(word_freq)
+
+    def search(self, word: str) -> int:
+        """
+        search for a word
+        @param word: the word to be searched
+        @return: frequency > 0 if found and 0 if NOT found
+        """
+
+        encoded = word.encode()
+        entry = self.slots[self._find_slot(encoded, hash(encoded))]
+        if entry < 0:
+            return 0 # word not found
+        return self.frequencies[entry]
+
+    def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
+        """
+        add a word and its frequency to the dictionary
+        @param word_frequency: (word, frequency) to be added
+        :return: True whether succeeded, False when word is already in the dictionary
+        """
+
+        encoded = word_frequency.word.encode()
+        word_hash = hash(encoded)
+        slot = self._find_slot(encoded, word_hash)
+        entry = self.slots[slot]
+        if entry >= 0:
+            return False # word already in the dictionary
+
+        if entry <= TOMBSTONE and self._capacity(TOMBSTONE - entry) >= len(encoded):
+            # the slot of a deleted word, whose entry and arena bytes are overwritten
+            entry = TOMBSTONE - entry
+            self.arena[self.offsets[entry]:self.offsets[entry] + len(encoded)] = encoded
+            self.lengths[entry] = len(encoded)
+            self.hashes[entry] = word_hash
+            self.frequencies[entry] = word_frequency.frequency
+            self.slots[slot] = entry
+            self.live_count += 1
+            return True
+
+        # a tombstone taken over by a longer word leaves its dead entry behind
+        if (entry == EMPTY and self.used_slots + 1 > MAX_LOAD * len(self.slots)) or \
+                len(self.offsets) - self.live_count > self.live_count + MIN_SLOTS:
+            self._resize()
+            slot = self._find_slot(encoded, word_hash)
+
+        if self.slots[slot] == EMPTY:
+            self.used_slots += 1 # a tombstone slot was already counted
+        self.slots[slot] = self._append_entry(encoded, word_hash, word_frequency.frequency)
+        self.live_count += 1
+        return True
+
+    def delete_word(self, word: str) -> bool:
+        """
+        delete a word from the dictionary
+        @param word: word to be deleted
+        @return: whether succeeded, e.g. return False when point not found
+        """
+
+        encoded = word.encode()
+        slot = self._find_slot(encoded, hash(encoded))
+        entry = self.slots[slot]
+        if entry < 0:
+            return False # word not found
+
+        self.slots[slot] = TOMBSTONE - entry
+        self.lengths[entry] = -1
+        self.live_count -= 1
+        return True
+
+    def autocomplete(self, word: str) -> List[WordFrequency]:
+        """
+        return a list of 3 most-frequent words in the dictionary that have 'word' as a prefix
+        @param word: word to be autocompleted
+        @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'word'
+        """
+
+        encoded = word.encode()
+        arena, offsets, lengths, frequencies = self.arena, self.offsets, self.lengths, self.frequencies
+        # comparing in place in the arena, only the matches are decoded
+        matches = []
+        for entry in range(len(offsets)):
+            length = lengths[entry]
+            if length >= len(encoded) and arena.startswith(encoded, offsets[entry], offsets[entry] + length):
+                matches.append((-frequencies[entry], arena[offsets[entry]:offsets[entry] + length]))
+
+        return [WordFrequency(encoded_word.decode(), -frequency) for frequency, encoded_word in heapq.nsmallest(3, matches)]
+
+    def _find_slot(self, encoded: bytes, word_hash: int) -> int:
+        """
+        probe the table for a word
+        @param encoded: the word, UTF-8 encoded
+        @param word_hash: hash of 'encoded'
+        @return: the slot holding the word, or else the slot where it should be inserted
+        (the first tombstone met, or the empty slot that ended the probe)
+        """
+        slots, hashes, offsets, lengths, arena = self.slots, self.hashes, self.offsets, self.lengths, self.arena
+        mask = len(slots) - 1
+        slot = word_hash & mask
+        free_slot = EMPTY
+        while True:
+            entry = slots[slot]
+            if entry == EMPTY:
+                return slot if free_slot == EMPTY else free_slot
+            if entry <= TOMBSTONE:
+                if free_slot == EMPTY:
+                    free_slot = slot
+            elif hashes[entry] == word_hash and lengths[entry] == len(encoded) and \
+                    arena.startswith(encoded, offsets[entry]):
+                return slot
+            slot = (slot + 1) & mask
+
+    def _capacity(self, entry: int) -> int:
+        """
+        @return: number of arena bytes an entry can hold, up to the start of the next entry
+        """
+        if entry + 1 < len(self.offsets):
+            return self.offsets[entry + 1] - self.offsets[entry]
+        return len(self.arena) - self.offsets[entry]
+
+    def _append_entry(self, encoded: bytes, word_hash: int, frequency: int) -> int:
+        """
+        store a word at the end of the arena and the entry columns
+        @return: ID of the new entry
+        """
+        self.offsets.append(len(self.arena))
+        self.lengths.append(len(encoded))
+        self.hashes.append(word_hash)
+        self.frequencies.append(frequency)
+        self.arena += encoded
+        return len(self.offsets) - 1
+
+    def _resize(self):
+        """
+        rebuild the table for the live entries, sized so that they use at most half of the load limit,
+        which clears the tombstones and drops deleted words from the arena
+        """
+        slot_count = MIN_SLOTS
+        while slot_count * MAX_LOAD < 2 * (self.live_count + 1):
+            slot_count *= 2
+
+        arena, offsets, lengths, hashes, frequencies = self.arena, self.offsets, self.lengths, self.hashes, self.frequencies
+        self._reset(slot_count)
+        mask = slot_count - 1
+        for entry in range(len(offsets)):
+            if lengths[entry] < 0:
+                continue
+            slot = hashes[entry] & mask
+            while self.slots[slot] != EMPTY:
+                slot = (slot + 1) & mask
+            self.slots[slot] = self._append_entry(
+                arena[offsets[entry]:offsets[entry] + lengths[entry]], hashes[entry], frequencies[entry])
+        self.used_slots = self.live_count = len(self.offsets)
@@ -0,0 +1,83 @@
+import multiprocessing
+from typing import TextIO
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.command_executor import AUTOCOMPLETE, UNKNOWN, FLUSH_SIZE, tokenize, execute, format_autocomplete
+from dictionary.sharding import shard_of, merge_top_k
+
+
+# ------------------------------------------------------------------------
+# Parallel execution of command files over a process pool.
+#
+# The words are split into one shard per process. Each process builds a
+# dictionary from the words of its shard and replays, in file order, the
+# commands on those words plus every autocomplete command. A shard sees the
+# commands on its own words in their original order, so each of its
+# answers is the one the serial run would give, and an autocomplete is
+# answered by merging the top words of every shard at that point.
+# The parent process then stitches the answers back into command order.
+# ------------------------------------------------------------------------
+
+def run_parallel(agent: BaseDictionary, data_filename: str, command_filename: str, output_file: TextIO,
+                 process_count: int):
+    """
+    run a command file on a sharded dictionary, one shard per process
+    @param agent: an empty dictionary, copied into every process to hold its shard
+    @param data_filename: the data file, read by every process
+    @param command_filename: the command file, read by every process
+    @param output_file: where the output lines are written, the same as a serial run
+    @param process_count: number of processes and shards
+    """
+
+    tasks = [(agent, data_filename, command_filename, shard, process_count) for shard in range(process_count)]
+    with multiprocessing.Pool(process_count) as pool:
+        shard_outputs = pool.map(_run_shard, tasks)
+
+    # taking the next answer of the shard owning each command, or of every shard for an autocomplete
+    positions = [0] * process_count
+    buffer = []
+    with open(command_filename, 'r') as command_file:
+        for command in tokenize(command_file):
+            opcode, word, argument = command
+            if opcode == AUTOCOMPLETE:
+                shard_results = [shard_outputs[shard][positions[shard]] for shard in range(process_count)]
+                for shard in range(process_count):
+                    positions[shard] += 1
+                list_words = [WordFrequency(i, frequency) for i, frequency in merge_top_k(shard_results)]
+                buffer.append(format_autocomplete(word, list_words))
+            elif opcode == UNKNOWN:
+                buffer.append(execute(agent, command))
+            else:
+                shard = shard_of(word, process_count)
+                buffer.append(shard_outputs[shard][positions[shard]])
+                positions[shard] += 1
+            if len(buffer) >= FLUSH_SIZE:
+                output_file.write(''.join(buffer))
+                buffer.clear()
+    output_file.write(''.join(buffer))
+
+
+def _run_shard(task: tuple) -> list:
+    """
+    build one shard and replay its commands, run in a pool process
+    @param task: (empty dictionary, data file, command file, shard, number of shards)
+    @return: in command order, the output line of each command on the shard's words and
+    the (word, frequency) answer of each autocomplete
+    """
+    agent, data_filename, command_filename, shard, shard_count = task
+
+    words, frequencies = read_columns(data_filename)
+    rows = [row for row, word in enumerate(words) if shard_of(word, shard_count) == shard]
+    build_from_columns(agent, [words[row] for row in rows], [frequencies[row] for row in rows])
+    del words, frequencies, rows
+
+    outputs = []
+    with open(command_filename, 'r') as command_file:
+        for command in tokenize(command_file):
+            opcode, word, argument = command
+            if opcode == AUTOCOMPLETE:
+                outputs.append([(i.word, i.frequency) for i in agent.autocomplete(word)])
+            elif opcode != UNKNOWN and shard_of(word, shard_count) == shard:
+                outputs.append(execute(agent, command))
+    return outputs
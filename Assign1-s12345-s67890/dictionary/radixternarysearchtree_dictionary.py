@@ -0,0 +1,313 @@
+import heapq
+from typing import Iterable, List
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+from dictionary.ternarysearchtree_dictionary import balanced_insertion_order
+
+
+# ------------------------------------------------------------------------
+# Radix-compressed Ternary Search Tree.
+#
+# A chain of nodes that only continue through their middle child is
+# collapsed into one node whose label holds all of its letters. Siblings
+# are still kept in a binary search tree ordered by the first letter of
+# their labels. Every node that does not end a word has at least two
+# children in its middle tree, adds split labels and deletes merge them
+# back to keep it that way.
+# ------------------------------------------------------------------------
+
+
+# Class representing a node in the radix-compressed Ternary Search Tree
+class RadixNode:
+
+    def __init__(self, label=None, frequency=None, end_word=False):
+        self.label = label              # letters on the edge into this node, the first one orders it among its siblings
+        self.frequency = frequency      # frequency of the word if the label ends a word
+        self.end_word = end_word        # True if the label ends a word
+        self.left = None    # pointing to the left sibling RadixNode, whose label starts with a letter < self.label[0]
+        self.middle = None  # pointing to the middle child RadixNode, which continues after self.label
+        self.right = None   # pointing to the right sibling RadixNode, whose label starts with a letter > self.label[0]
+
+
+class RadixTernarySearchTreeDictionary(BaseDictionary):
+
+    def __init__(self):
+        self.root = None
+        self.node_count = 0
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
+        """
+        construct the data structure to store nodes
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
+        """
+
+        self.root = None
+        self.node_count = 0
+        for word_freq in balanced_insertion_order(words_frequencies):
+            self.add_word_frequency(word_freq)
+
+    def search(self, word: str) -> int:
+        """
+        search for a word
+        @param word: the word to be searched
+        @return: frequency > 0 if found and 0 if NOT found
+        """
+
+        current_node = self.root
+        word_length = len(word)
+        i = 0
+        while current_node != None and i < word_length:
+            letter = word[i]
+            label = current_node.label
+            if letter < label[0]:
+                current_node = current_node.left
+            elif letter > label[0]:
+                current_node = current_node.right
+            else:
+                if not word.startswith(label, i):
+                    return 0 # the word leaves the label
+                i += len(label)
+                if i == word_length:
+                    return current_node.frequency if current_node.end_word else 0
+                current_node = current_node.middle
+
+        return 0 # word not found in the tree
+
+    def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
+        """
+        add a word and its frequency to the dictionary
+        @param word_frequency: (word, frequency) to be added
+        :return: True whether succeeded, False when word is already in the dictionary
+        """
+
+        word = word_frequency.word
+        word_length = len(word)
+        if word_length == 0:
+            return False
+        if self.root == None:
+            self.root = self._new_node(word, word_frequency.frequency)
+            return True
+
+        current_node = self.root
+        i = 0
+        while True:
+            letter = word[i]
+            label = current_node.label
+            # traversing the left side of the tree
+            if letter < label[0]:
+                if current_node.left == None:
+                    current_node.left = self._new_node(word[i:], word_frequency.frequency)
+                    return True
+                current_node = current_node.left
+
+            # traversing the right side of the tree
+            elif letter > label[0]:
+                if current_node.right == None:
+                    current_node.right = self._new_node(word[i:], word_frequency.frequency)
+                    return True
+                current_node = current_node.right
+
+            else:
+                # length of the common part of the label and the rest of the word
+                common = 1
+                while common < len(label) and i + common < word_length and label[common] == word[i + common]:
+                    common += 1
+                if common < len(label):
+                    self._split(current_node, common)
+                i += common
+
+                if i == word_length:
+                    if current_node.end_word:
+                        return False # word already in the dictionary
+                    current_node.end_word = True
+                    current_node.frequency = word_frequency.frequency
+                    return True
+                if current_node.middle == None:
+                    current_node.middle = self._new_node(word[i:], word_frequency.frequency)
+                    return True
+                current_node = current_node.middle
+
+    def delete_word(self, word: str) -> bool:
+        """
+        delete a word from the dictionary
+        @param word: word to be deleted
+        @return: whether succeeded, e.g. return False when point not found
+        """
+
+        # the node ending the word, the parent and link pointing to it,
+        # and the node whose middle tree holds it
+        current_node = self.root
+        parent, link = None, None
+        owner = None
+        word_length = len(word)
+        i = 0
+        while current_node != None and i < word_length:
+            letter = word[i]
+            label = current_node.label
+            if letter < label[0]:
+                parent, link = current_node, 'left'
+                current_node = current_node.left
+            elif letter > label[0]:
+                parent, link = current_node, 'right'
+                current_node = current_node.right
+            else:
+                if not word.startswith(label, i):
+                    return False
+                i += len(label)
+                if i == word_length:
+                    break
+                owner = current_node
+                parent, link = current_node, 'middle'
+                current_node = current_node.middle
+
+        if current_node == None or i != word_length or not current_node.end_word:
+            return False # given word not present in the dictionary
+
+        current_node.end_word = False
+        current_node.frequency = None
+
+        if current_node.middle != None:
+            # the node is now only a path to its middle tree, absorb that tree if it is a single node
+            self._merge_single_child(current_node)
+            return True
+
+        # the node leads nowhere, unlink it from its siblings and merge its owner if left with one child
+        self._replace(parent, link, self._without(current_node))
+        self.node_count -= 1
+        if owner != None and not owner.end_word:
+            self._merge_single_child(owner)
+        return True # word deleted
+
+    def autocomplete(self, word: str) -> List[WordFrequency]:
+        """
+        return a list of 3 most-frequent words in the dictionary that have 'word' as a prefix
+        @param word: word to be autocompleted
+        @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'word'
+        """
+        return self.autocomplete_top_k(word, 3)
+
+    def autocomplete_top_k(self, word: str, k: int) -> List[WordFrequency]:
+        """
+        return a list of the k most-frequent words in the dictionary that have 'word' as a prefix
+        @param word: word to be autocompleted
+        @param k: number of words wanted
+        @return: a list (could be empty) of (at most) k most-frequent words with prefix 'word'
+        """
+
+        if k <= 0:
+            return []
+        word_li = []
+        stack = [(self.root, '')] # (node, prefix before the node label), the whole tree for an empty prefix
+
+        if word != '':
+            # descending to the node whose label covers the end of the prefix
+            current_node = self.root
+            word_length = len(word)
+            prefix = ''
+            i = 0
+            while current_node != None:
+                letter = word[i]
+                label = current_node.label
+                if letter < label[0]:
+                    current_node = current_node.left
+                elif letter > label[0]:
+                    current_node = current_node.right
+                else:
+                    rest = word[i:i + len(label)]
+                    if not label.startswith(rest):
+                        return []
+                    prefix += label
+                    i += len(label)
+                    if i >= word_length:
+                        break
+                    current_node = current_node.middle
+
+            if current_node == None:
+                return [] # returning an empty list as word not found
+
+            if current_node.end_word:
+                word_li.append((prefix, current_node.frequency))
+            stack = [(current_node.middle, prefix)]
+
+        while stack:
+            node, node_prefix = stack.pop()
+            if node == None:
+                continue
+            if node.end_word:
+                word_li.append((node_prefix + node.label, node.frequency))
+            stack.append((node.left, node_prefix))
+            stack.append((node.middle, node_prefix + node.label))
+            stack.append((node.right, node_prefix))
+
+        word_li = heapq.nsmallest(k, word_li, key=lambda x: (-x[1], x[0]))
+        return [WordFrequency(found_word, frequency) for found_word, frequency in word_li]
+
+    def _new_node(self, label: str, frequency: int) -> RadixNode:
+        """
+        create a node ending a word
+        @param label: letters on the edge into the node
+        @param frequency: frequency of the word
+        @return: the new node
+        """
+        self.node_count += 1
+        return RadixNode(label, frequency, True)
+
+    def _split(self, node: RadixNode, length: int):
+        """
+        cut the label of a node after 'length' letters, the rest moves to a new middle child
+        @param node: node to be split
+        @param length: number of letters kept on the node
+        """
+        child = RadixNode(node.label[length:], node.frequency, node.end_word)
+        child.middle = node.middle
+        node.label = node.label[:length]
+        node.frequency = None
+        node.end_word = False
+        node.middle = child
+        self.node_count += 1
+
+    def _merge_single_child(self, node: RadixNode):
+        """
+        append the label of the middle child to the node when that child has no siblings
+        @param node: node that does not end a word
+        """
+        child = node.middle
+        if child == None or child.left != None or child.right != None:
+            return
+        node.label += child.label
+        node.frequency = child.frequency
+        node.end_word = child.end_word
+        node.middle = child.middle
+        self.node_count -= 1
+
+    def _without(self, node: RadixNode) -> RadixNode:
+        """
+        remove a node from its sibling tree
+        @param node: root of the sibling subtree holding the node
+        @return: new root of that subtree
+        """
+        if node.left == None:
+            return node.right
+        if node.right == None:
+            return node.left
+
+        # two siblings: the leftmost node of the right subtree takes the place of the node
+        successor_parent = None
+        successor = node.right
+        while successor.left != None:
+            successor_parent = successor
+            successor = successor.left
+        if successor_parent != None:
+            successor_parent.left = successor.right
+            successor.right = node.right
+        successor.left = node.left
+        return successor
+
+    def _replace(self, parent: RadixNode, link: str, node: RadixNode):
+        """
+        point the link of a parent (or the root when there is no parent) to a node
+        """
+        if parent == None:
+            self.root = node
+        else:
+            setattr(parent, link, node)
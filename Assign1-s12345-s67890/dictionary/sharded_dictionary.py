@@ -0,0 +1,208 @@
+import multiprocessing
+from array import array
+from typing import Callable, Iterable, List
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.word_frequency import WordFrequency
+from dictionary import command_executor, data_loader
+from dictionary.sharding import shard_of, shard_of_first_letter, merge_top_k
+
+
+# ------------------------------------------------------------------------
+# Dictionary split over several underlying dictionaries (shards).
+#
+# Every word is routed to one shard, by a hash of the word or by its first
+# letter. Search, add, delete and update go to the shard of the word.
+# Autocomplete asks every shard that can hold words with the prefix (all
+# of them with hash routing, just one with first letter routing unless
+# the prefix is empty) for its top words and merges them with a heap.
+#
+# The shards live in this process, or each in a worker process of its own
+# that receives the operations through a pipe. With worker processes
+# the requests to all the shards involved are sent before any answer is
+# read, so that the shards work at the same time, e.g. on their part of
+# build_dictionary or of an autocomplete. A ShardedDictionary must be used
+# from one thread at a time, and close() stops its worker processes.
+# ------------------------------------------------------------------------
+
+class ShardedDictionary(BaseDictionary):
+
+    def __init__(self, make_shard: Callable[[], BaseDictionary], shard_count: int,
+                 by_first_letter: bool = False, worker_processes: bool = False):
+        """
+        @param make_shard: returns an empty dictionary, called once per shard
+        @param shard_count: number of shards
+        @param by_first_letter: route the words by their first letter instead of by hash
+        @param worker_processes: run each shard in a worker process instead of in this process
+        """
+        self.shard_count = shard_count
+        self.by_first_letter = by_first_letter
+        shard_type = ProcessShard if worker_processes else LocalShard
+        self.shards = [shard_type(make_shard()) for _ in range(shard_count)]
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
+        """
+        construct the data structure to store nodes
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
+        """
+        self._build((word_frequency.word, word_frequency.frequency) for word_frequency in words_frequencies)
+
+    def build_from_columns(self, words: List[str], frequencies):
+        """
+        construct the data structure from parallel sequences of words and frequencies
+        @param words: the words, duplicates handled as build_dictionary does
+        @param frequencies: the frequency of each word
+        """
+        self._build(zip(words, frequencies))
+
+    def search(self, word: str) -> int:
+        """
+        search for a word
+        @param word: the word to be searched
+        @return: frequency > 0 if found and 0 if NOT found
+        """
+        return self._call_shard(word, 'search', word)
+
+    def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
+        """
+        add a word and its frequency to the dictionary
+        @param word_frequency: (word, frequency) to be added
+        @return: True whether succeeded, False when word is already in the dictionary
+        """
+        return self._call_shard(word_frequency.word, 'add_word_frequency', word_frequency)
+
+    def delete_word(self, word: str) -> bool:
+        """
+        delete a word from the dictionary
+        @param word: word to be deleted
+        @return: whether succeeded, e.g. return False when point not found
+        """
+        return self._call_shard(word, 'delete_word', word)
+
+    def update_frequency(self, word: str, delta: int) -> bool:
+        """
+        change the frequency of a word by 'delta', deleting it when the frequency drops to 0 or below
+        @return: whether succeeded, e.g. return False when word not found
+        """
+        return self._call_shard(word, 'update_frequency', word, delta)
+
+    def autocomplete(self, prefix_word: str) -> List[WordFrequency]:
+        """
+        return a list of 3 most-frequent words in the dictionary that have 'prefix_word' as a prefix
+        @param prefix_word: word to be autocompleted
+        @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'prefix_word'
+        """
+        if self.by_first_letter and prefix_word != '':
+            shards = [self.shards[self._shard_of(prefix_word)]]
+        else:
+            shards = self.shards
+        for shard in shards:
+            shard.send('autocomplete', prefix_word)
+        shard_results = [shard.receive() for shard in shards]
+        return [WordFrequency(word, frequency) for word, frequency in merge_top_k(shard_results)]
+
+    def close(self):
+        """
+        stop the worker processes, if any. The dictionary can't be used afterwards.
+        """
+        for shard in self.shards:
+            shard.close()
+
+    def _shard_of(self, word: str) -> int:
+        if self.by_first_letter:
+            return shard_of_first_letter(word, self.shard_count)
+        return shard_of(word, self.shard_count)
+
+    def _call_shard(self, word: str, operation: str, *args):
+        shard = self.shards[self._shard_of(word)]
+        shard.send(operation, *args)
+        return shard.receive()
+
+    def _build(self, pairs: Iterable[tuple]):
+        # splitting the (word, frequency) pairs into columns per shard, then building all the shards at once
+        columns = [([], array('q')) for _ in range(self.shard_count)]
+        for word, frequency in pairs:
+            words, frequencies = columns[self._shard_of(word)]
+            words.append(word)
+            frequencies.append(frequency)
+        for shard, (words, frequencies) in zip(self.shards, columns):
+            shard.send('build_from_columns', words, frequencies)
+        for shard in self.shards:
+            shard.receive()
+
+
+def apply_operation(agent: BaseDictionary, operation: str, args: tuple):
+    """
+    run an operation on the dictionary of a shard
+    @param agent: the dictionary of the shard
+    @param operation: name of a ShardedDictionary method
+    @param args: arguments of the operation
+    @return: the result of the operation, autocomplete answers as (word, frequency) pairs
+    """
+    if operation == 'autocomplete':
+        return [(i.word, i.frequency) for i in agent.autocomplete(*args)]
+    if operation == 'update_frequency':
+        return command_executor.update_frequency(agent, *args)
+    if operation == 'build_from_columns':
+        return data_loader.build_from_columns(agent, *args)
+    return getattr(agent, operation)(*args)
+
+
+class LocalShard:
+    """
+    a shard in this process, which runs each operation as soon as it is sent
+    """
+
+    def __init__(self, agent: BaseDictionary):
+        self.agent = agent
+        self.result = None
+
+    def send(self, operation: str, *args):
+        self.result = apply_operation(self.agent, operation, args)
+
+    def receive(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+class ProcessShard:
+    """
+    a shard in a worker process, which runs the operations in the order they are sent
+    """
+
+    def __init__(self, agent: BaseDictionary):
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_serve_shard, args=(agent, worker_connection), daemon=True)
+        self.process.start()
+        worker_connection.close()
+
+    def send(self, operation: str, *args):
+        self.connection.send((operation, args))
+
+    def receive(self):
+        failed, result = self.connection.recv()
+        if failed:
+            raise result # the exception raised in the worker
+        return result
+
+    def close(self):
+        self.connection.send(None)
+        self.process.join()
+        self.connection.close()
+
+
+def _serve_shard(agent: BaseDictionary, connection):
+    """
+    run the operations received on 'connection' until None is received, run in a worker process
+    """
+    while True:
+        request = connection.recv()
+        if request == None:
+            break
+        operation, args = request
+        try:
+            connection.send((False, apply_operation(agent, operation, args)))
+        except Exception as e:
+            connection.send((True, e))
+    connection.close()
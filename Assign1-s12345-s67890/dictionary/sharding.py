@@ -0,0 +1,43 @@
+import heapq
+import zlib
+from typing import Iterable, List, Tuple
+
+
+# ------------------------------------------------------------------------
+# Helpers for splitting a dictionary into shards by word.
+#
+# A word always goes to the same shard, computed from a CRC32 of its UTF-8
+# bytes so that every process agrees on it (the built-in hash of a string
+# changes between processes). Words can instead be placed by their first
+# letter, so that all the words with a given prefix are in one shard.
+# Each shard answers autocomplete for its own words, and the shard answers
+# are merged into the overall top k.
+# ------------------------------------------------------------------------
+
+def shard_of(word: str, shard_count: int) -> int:
+    """
+    @param word: the word to be placed
+    @param shard_count: number of shards
+    @return: the shard holding 'word', in range(shard_count)
+    """
+    return zlib.crc32(word.encode()) % shard_count
+
+
+def shard_of_first_letter(word: str, shard_count: int) -> int:
+    """
+    @param word: the word to be placed, or a non-empty prefix of the words wanted
+    @param shard_count: number of shards
+    @return: the shard holding 'word' and every word starting with its first letter, in range(shard_count)
+    """
+    return shard_of(word[:1], shard_count)
+
+
+def merge_top_k(shard_results: Iterable[List[Tuple[str, int]]], k: int = 3) -> List[Tuple[str, int]]:
+    """
+    merge the autocomplete answers of several shards, no word being in two shards
+    @param shard_results: for each shard, its (word, frequency) answer
+    @param k: number of words wanted
+    @return: the k most frequent (word, frequency) of all answers, ties broken alphabetically
+    """
+    return heapq.nsmallest(k, (word_freq for result in shard_results for word_freq in result),
+                           key=lambda x: (-x[1], x[0]))
@@ -0,0 +1,264 @@
+import heapq
+import threading
+from array import array
+from itertools import repeat
+from typing import Iterable, List
+from dictionary.word_frequency import WordFrequency
+
+
+# ------------------------------------------------------------------------
+# Infix (substring) autocomplete over a suffix array.
+#
+# The words are stored once, joined into a single text, and a suffix is
+# its integer offset in that text. The offsets are sorted by the suffix
+# they start, so the words containing a fragment are the owners of a
+# contiguous range of offsets, found with two binary searches that only
+# compare fragment-long slices of the text. Words are ranked once by
+# descending frequency (ties alphabetical) and a segment tree over the
+# suffix ranks returns the best suffix of any range, so the top k of a
+# range are popped best-first without looking at the rest of it.
+#
+# Added words wait in a small pending table and deleted words are skipped,
+# both until rebuild_ratio of the indexed words has changed. A new suffix
+# array is then built in a background thread from the words of the old
+# one, and swapped in with the changes made while it was being built.
+# ------------------------------------------------------------------------
+
+NO_SUFFIX = -1
+SEPARATOR = '\x00' # ends every word in the text, sorts before any letter
+
+
+class SuffixArray:
+    """
+    the suffixes of a fixed set of words, never changed once built
+    """
+
+    def __init__(self, frequencies: dict):
+        """
+        @param frequencies: frequency of every word to be indexed
+        """
+        self.frequencies = frequencies
+        # rank of a word = its position in descending frequency order
+        self.ranked_words = sorted(frequencies, key=lambda word: (-frequencies[word], word))
+        self.text = text = SEPARATOR.join(self.ranked_words) + SEPARATOR
+
+        rank_at = array('i') # rank of the word each position of the text belongs to
+        for rank, word in enumerate(self.ranked_words):
+            rank_at.extend(repeat(rank, len(word) + 1))
+
+        # sorting by the first two letters, then each bucket by whole suffix,
+        # so that only one bucket of suffix strings exists at a time
+        buckets = {}
+        for offset, letter in enumerate(text):
+            if letter != SEPARATOR:
+                buckets.setdefault(text[offset:offset + 2], array('i')).append(offset)
+        self.offsets = array('i')
+        for key in sorted(buckets):
+            self.offsets.extend(sorted(buckets.pop(key), key=lambda offset: text[offset:text.index(SEPARATOR, offset)]))
+        self.suffix_ranks = array('i', [rank_at[offset] for offset in self.offsets])
+        del rank_at
+
+        # segment tree: node i holds the position of the best ranked suffix below it, leaves start at len(offsets)
+        size = len(self.offsets)
+        self.tree = array('i', [NO_SUFFIX]) * size + array('i', range(size))
+        for node in range(size - 1, 0, -1):
+            self.tree[node] = self._better(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def range_of(self, fragment: str):
+        """
+        @param fragment: a substring to be found
+        @return: (low, high) such that offsets[low:high] are the suffixes starting with 'fragment'
+        """
+        return self._bound(fragment, False), self._bound(fragment, True)
+
+    def _bound(self, fragment: str, after: bool) -> int:
+        """
+        @return: the first position whose suffix sorts after 'fragment' (after=True) or not before it,
+        comparing the fragment with as many letters of the suffix
+        """
+        text, offsets, length = self.text, self.offsets, len(fragment)
+        low, high = 0, len(offsets)
+        while low < high:
+            middle = (low + high) // 2
+            offset = offsets[middle]
+            letters = text[offset:offset + length]
+            if letters < fragment or (after and letters == fragment):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def push_range(self, heap: list, low: int, high: int):
+        """
+        push a non-empty suffix range on the heap, keyed by its best rank
+        """
+        if low < high:
+            position = self._best_in_range(low, high)
+            heapq.heappush(heap, (self.suffix_ranks[position], position, low, high))
+
+    def _better(self, first: int, second: int) -> int:
+        """
+        @return: the better ranked of two suffix positions, NO_SUFFIX counting as worst
+        """
+        if first == NO_SUFFIX:
+            return second
+        if second == NO_SUFFIX:
+            return first
+        return first if self.suffix_ranks[first] <= self.suffix_ranks[second] else second
+
+    def _best_in_range(self, low: int, high: int) -> int:
+        """
+        @return: position of the best ranked suffix in offsets[low:high]
+        """
+        best = NO_SUFFIX
+        low += len(self.offsets)
+        high += len(self.offsets)
+        while low < high:
+            if low & 1:
+                best = self._better(best, self.tree[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                best = self._better(best, self.tree[high])
+            low >>= 1
+            high >>= 1
+        return best
+
+
+class SuffixArrayIndex:
+
+    def __init__(self, rebuild_ratio: float = 0.1):
+        """
+        @param rebuild_ratio: fraction of pending or deleted words above which the index is rebuilt
+        """
+        self.rebuild_ratio = rebuild_ratio
+        self.lock = threading.Lock() # guards the swap of a suffix array built in the background
+        self.rebuild = None # thread building the next suffix array
+        self.build([])
+
+    def build(self, words_frequencies: Iterable[WordFrequency]):
+        """
+        construct the suffix array
+        @param words_frequencies: iterable of (word, frequency) to be indexed, read in a single pass,
+        the first occurrence of a word wins
+        """
+        self.wait_rebuild()
+        frequencies = {}
+        for word_freq in words_frequencies:
+            frequencies.setdefault(word_freq.word, word_freq.frequency)
+        self.suffix_array = SuffixArray(frequencies)
+        self.pending = {}    # words added since the suffix array was built, not in it
+        self.deleted = set() # words of the suffix array deleted since
+        self.changes = None  # while a rebuild runs, word -> frequency (None when deleted) changed since it started
+
+    def add_word(self, word_frequency: WordFrequency) -> bool:
+        """
+        add a word to the index
+        @param word_frequency: (word, frequency) to be added
+        @return: True whether succeeded, False when word is already indexed
+        """
+        word = word_frequency.word
+        with self.lock:
+            if word in self.pending or (word in self.suffix_array.frequencies and word not in self.deleted):
+                return False
+            self.pending[word] = word_frequency.frequency
+            if self.changes != None:
+                self.changes[word] = word_frequency.frequency
+            self._rebuild_if_stale()
+        return True
+
+    def delete_word(self, word: str) -> bool:
+        """
+        delete a word from the index
+        @param word: word to be deleted
+        @return: whether succeeded, e.g. return False when word is not indexed
+        """
+        with self.lock:
+            if word in self.pending:
+                del self.pending[word]
+            elif word in self.suffix_array.frequencies and word not in self.deleted:
+                self.deleted.add(word)
+            else:
+                return False
+            if self.changes != None:
+                self.changes[word] = None
+            self._rebuild_if_stale()
+        return True
+
+    def top_k_containing(self, fragment: str, k: int = 3) -> List[WordFrequency]:
+        """
+        return the k most-frequent words that contain 'fragment' anywhere
+        @param fragment: the substring to be found
+        @param k: number of words wanted
+        @return: a list (could be empty) of (at most) k most-frequent words containing 'fragment'
+        """
+
+        if k <= 0:
+            return []
+
+        with self.lock:
+            suffix_array = self.suffix_array
+            low, high = suffix_array.range_of(fragment)
+
+            # popping ranges by their best suffix, each pop splits the range around that suffix
+            found = []
+            seen = set()
+            heap = []
+            suffix_array.push_range(heap, low, high)
+            while heap and len(found) < k:
+                rank, position, range_low, range_high = heapq.heappop(heap)
+                word = suffix_array.ranked_words[rank]
+                if word not in seen and word not in self.deleted:
+                    seen.add(word)
+                    found.append((word, suffix_array.frequencies[word]))
+                suffix_array.push_range(heap, range_low, position)
+                suffix_array.push_range(heap, position + 1, range_high)
+
+            found.extend((word, frequency) for word, frequency in self.pending.items() if fragment in word)
+        found = heapq.nsmallest(k, found, key=lambda x: (-x[1], x[0]))
+        return [WordFrequency(word, frequency) for word, frequency in found]
+
+    def wait_rebuild(self):
+        """
+        wait until the suffix arrays being built in the background have been swapped in
+        """
+        rebuild = self.rebuild
+        while rebuild != None:
+            rebuild.join()
+            rebuild = self.rebuild # a swap starts the next rebuild when the index is stale again
+
+    def _rebuild_if_stale(self):
+        """
+        start building a new suffix array in the background once pending or deleted words pass
+        rebuild_ratio of the indexed words, called holding the lock
+        """
+        if self.rebuild != None or \
+                len(self.pending) + len(self.deleted) <= self.rebuild_ratio * max(len(self.suffix_array.frequencies), 1):
+            return
+        self.changes = {}
+        self.rebuild = threading.Thread(target=self._rebuild,
+                                        args=(self.suffix_array, dict(self.pending), set(self.deleted)), daemon=True)
+        self.rebuild.start()
+
+    def _rebuild(self, suffix_array: SuffixArray, pending: dict, deleted: set):
+        """
+        build the suffix array of the words indexed when the rebuild started and swap it in, run in
+        the background thread. The old suffix array is never changed, so it is read without the lock.
+        """
+        frequencies = {word: frequency for word, frequency in suffix_array.frequencies.items() if word not in deleted}
+        frequencies.update(pending)
+        new_suffix_array = SuffixArray(frequencies)
+
+        with self.lock:
+            # the words changed since the rebuild started are pending or deleted in the new suffix array
+            self.pending = {}
+            self.deleted = set()
+            for word, frequency in self.changes.items():
+                if word in frequencies:
+                    self.deleted.add(word)
+                if frequency != None:
+                    self.pending[word] = frequency
+            self.suffix_array = new_suffix_array
+            self.changes = None
+            self.rebuild = None
+            self._rebuild_if_stale()
@@ -1,7 +1,11 @@
-from typing import List
+import heapq
+from array import array
+from typing import Iterable, List
 from dictionary.base_dictionary import BaseDictionary
 from dictionary.word_frequency import WordFrequency
 from dictionary.node import Node
+from dictionary import tst_snapshot
+from dictionary.autocomplete_session import AutocompleteSession
 
 
 # ------------------------------------------------------------------------
@@ -11,18 +15,123 @@ from dictionary.node import Node
 # __copyright__ = 'Copyright 2022, RMIT University'
 # ------------------------------------------------------------------------
 
+TOP_K = 3 # number of words cached on every node for autocomplete
+
+
+class TopWordsNode(Node):
+    """
+    a Node that also keeps the bound and the cache used by autocomplete
+    """
+
+    def __init__(self, letter=None, frequency=None, end_word=False):
+        super().__init__(letter, frequency, end_word)
+        self.max_frequency = 0  # highest frequency of any word in the subtree below this node, left and right included
+        self.top_words = []  # cached (word, frequency) pairs of the most frequent words sharing the prefix ending here
+
+
+def _rank(word_freq):
+    """
+    sort key for cached (word, frequency) pairs: most frequent first, ties broken alphabetically
+    """
+    return -word_freq[1], word_freq[0]
+
+
+def _offer_top_word(node: Node, word: str, frequency: int):
+    """
+    offer a newly added word to the cached top words of a node on its path
+    @param node: node whose prefix is a prefix of 'word'
+    @param word: the word added
+    @param frequency: frequency of the word added
+    """
+    top_words = node.top_words
+    if len(top_words) == TOP_K and _rank((word, frequency)) >= _rank(top_words[-1]):
+        return # not good enough to enter the cache
+    top_words.append((word, frequency))
+    top_words.sort(key=_rank)
+    del top_words[TOP_K:]
+
+
+def _refresh_top_words(node: Node, prefix: str):
+    """
+    recompute the cached top words of a node from its own word and the caches of its middle children
+    @param node: node to be repaired
+    @param prefix: the prefix ending at this node
+    """
+    candidates = []
+    if node.end_word:
+        candidates.append((prefix, node.frequency))
+
+    # every node in the BST hanging off the middle link covers a distinct next letter
+    stack = [node.middle] if node.middle is not None else []
+    while stack:
+        child = stack.pop()
+        candidates.extend(child.top_words)
+        if child.left is not None:
+            stack.append(child.left)
+        if child.right is not None:
+            stack.append(child.right)
+
+    candidates.sort(key=_rank)
+    node.top_words = candidates[:TOP_K]
+
+
+def _refresh_max_frequency(node: Node):
+    """
+    recompute the subtree frequency bound of a node from its own word and its three children
+    @param node: node to be repaired
+    """
+    max_frequency = node.frequency if node.end_word else 0
+    for child in (node.left, node.middle, node.right):
+        if child is not None and child.max_frequency > max_frequency:
+            max_frequency = child.max_frequency
+    node.max_frequency = max_frequency
+
+
+def balanced_insertion_order(words_frequencies: Iterable[WordFrequency]):
+    """
+    yield the words sorted once and then median first, recursively, so that inserting them one by one
+    gives balanced left/right links whatever the order of the input
+    @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass,
+    the first occurrence of a word wins
+    """
+    # only the frequencies are kept, a WordFrequency is created when its word is yielded
+    unique_words = {}
+    for word_freq in words_frequencies:
+        unique_words.setdefault(word_freq.word, word_freq.frequency)
+    sorted_words = sorted(unique_words)
+
+    ranges = [(0, len(sorted_words))]
+    while ranges:
+        low, high = ranges.pop()
+        if low >= high:
+            continue
+        middle = (low + high) // 2
+        yield WordFrequency(sorted_words[middle], unique_words[sorted_words[middle]])
+        ranges.append((middle + 1, high))
+        ranges.append((low, middle))
+
 
 class TernarySearchTreeDictionary(BaseDictionary):
 
-    def build_dictionary(self, words_frequencies: List[WordFrequency]):
+    def __init__(self, compact_ratio: float = 0.25):
+        """
+        @param compact_ratio: fraction of dead nodes above which delete_word rebuilds the tree
+        """
+        self.compact_ratio = compact_ratio
+        self.reclaimed_nodes = 0 # total number of nodes freed by deletions and compactions
+        self.modifications = 0 # bumped by every change to the words, open sessions restart when it moves
+        self._clear()
+
+    def build_dictionary(self, words_frequencies: Iterable[WordFrequency]):
         """
         construct the data structure to store nodes
-        @param words_frequencies: list of (word, frequency) to be stored
+        @param words_frequencies: iterable of (word, frequency) to be stored, read in a single pass
         """
 
-        self.tst = Node() # creating a Node object
-        for word_freq in words_frequencies:
-            self.add_word_frequency(word_freq) 
+        self._clear()
+        self.modifications += 1
+        for word_freq in balanced_insertion_order(words_frequencies):
+            self.add_word_frequency(word_freq)
 
     def search(self, word: str) -> int:
         """
@@ -31,7 +140,7 @@ class TernarySearchTreeDictionary(BaseDictionary):
         @return: frequency > 0 if found and 0 if NOT found
         """
         
-        current_node = self.tst  
+        current_node = self.tst if self.tst.letter != None else None # an empty tree has a blank root
         word_length = len(word)
         i = 0
 
@@ -51,6 +160,49 @@ class TernarySearchTreeDictionary(BaseDictionary):
             return 0 # word not found in the tree
 
         return current_node.frequency # returning frequency as word is found
+
+    def search_many(self, words: List[str]) -> List[int]:
+        """
+        search for a batch of words. The batch is sorted so that words sharing a prefix are adjacent,
+        and each word only descends from where its common prefix with the previous word ended.
+        @param words: the words to be searched
+        @return: for each word in input order, frequency > 0 if found and 0 if NOT found
+        """
+
+        results = [0] * len(words)
+        if self.tst.letter == None:
+            return results # empty tree
+
+        matched_nodes = [] # node matching each letter of the previous word, as far as it was found
+        previous_word = ''
+        for index in sorted(range(len(words)), key=words.__getitem__):
+            word = words[index]
+            word_length = len(word)
+
+            # keeping the nodes of the prefix shared with the previous word
+            common = 0
+            limit = min(word_length, len(matched_nodes))
+            while common < limit and word[common] == previous_word[common]:
+                common += 1
+            del matched_nodes[common:]
+            previous_word = word
+
+            i = common
+            current_node = matched_nodes[-1].middle if matched_nodes else self.tst
+            while i < word_length and current_node != None:
+                letter = word[i]
+                if letter < current_node.letter:
+                    current_node = current_node.left
+                elif letter > current_node.letter:
+                    current_node = current_node.right
+                else:
+                    matched_nodes.append(current_node)
+                    i += 1
+                    current_node = current_node.middle
+
+            if word_length > 0 and len(matched_nodes) == word_length and matched_nodes[-1].end_word:
+                results[index] = matched_nodes[-1].frequency
+        return results
         
     
     def add_word_frequency(self, word_frequency: WordFrequency) -> bool:
@@ -60,9 +212,11 @@ class TernarySearchTreeDictionary(BaseDictionary):
         :return: True whether succeeded, False when word is already in the dictionary
         """
         
-        current_node = self.tst
+        current_node = self.tst # may be the blank root of an empty tree, it takes the first letter
         word_length = len(word_frequency.word)
         char_pos = 0 # position  of current letter in the word
+        prefix_nodes = [] # nodes whose prefix is a prefix of the word, their caches get the new word
+        path_nodes = [current_node] # every node visited, their subtrees will hold the new word
         while char_pos < word_length:
             letter = word_frequency.word[char_pos] 
             if current_node.letter == None:
@@ -71,26 +225,40 @@ class TernarySearchTreeDictionary(BaseDictionary):
             # traversing the left side of the tree
             if letter < current_node.letter:
                 if current_node.left == None:
-                    current_node.left = Node()
+                    current_node.left = self._new_node()
                 current_node = current_node.left
+                path_nodes.append(current_node)
             
             # traversing the right side of the tree
             elif letter > current_node.letter:
                 if current_node.right == None:
-                    current_node.right = Node()
+                    current_node.right = self._new_node()
                 current_node = current_node.right
+                path_nodes.append(current_node)
 
             elif letter == current_node.letter:
+                prefix_nodes.append(current_node)
                 if char_pos == word_length - 1:
                     break
                 if current_node.middle == None:
-                    current_node.middle = Node()
+                    if current_node.end_word == False:
+                        self.dead_nodes -= 1 # the node gets a middle child
+                    current_node.middle = self._new_node()
                 current_node = current_node.middle
+                path_nodes.append(current_node)
                 char_pos += 1
         # assigning the frequency to the current node
         if current_node.end_word == False:
+            if current_node.middle == None:
+                self.dead_nodes -= 1 # the node now ends a word
             current_node.end_word = True
             current_node.frequency = word_frequency.frequency
+            for node in prefix_nodes:
+                _offer_top_word(node, word_frequency.word, word_frequency.frequency)
+            for node in path_nodes:
+                if node.max_frequency < word_frequency.frequency:
+                    node.max_frequency = word_frequency.frequency
+            self.modifications += 1
             return True # word and frequency added to the dictionary
         return False # word already in the dictionary
 
@@ -104,43 +272,343 @@ class TernarySearchTreeDictionary(BaseDictionary):
         if self.search(word) == 0:
             return False # given word not present in the dictionary
 
+        # every node visited, with the parent and the link pointing to it
+        # and the length of the prefix ending at it (0 when the letter was not matched)
         current_node = self.tst 
-        node_li = []
+        parent, link = None, None
+        path = []
         word_length = len(word) 
         i = 0
         while i < word_length and current_node != None:
             letter = word[i] 
             if letter < current_node.letter:
+                path.append((current_node, parent, link, 0))
+                parent, link = current_node, 'left'
                 current_node = current_node.left
             elif letter == current_node.letter:
                 i += 1 
-                node_li.append(current_node) 
+                path.append((current_node, parent, link, i))
+                parent, link = current_node, 'middle'
                 if i < word_length:
                     current_node = current_node.middle
             else:
+                path.append((current_node, parent, link, 0))
+                parent, link = current_node, 'right'
                 current_node = current_node.right
 
-        node_li = node_li[::-1]
+        current_node.end_word = False
+        current_node.frequency = None
+        self.modifications += 1
 
-        i = 0
-        while i < len(node_li)-1:
-            node = node_li[i] 
-            if i == 0:
-                node.end_word = False
-            if node.middle == None and node.left == None and node.right == None:
-                node = None
-            i = i + 1
+        # going bottom-up, a node that no longer ends a word or leads to one through its middle
+        # is unlinked when it has at most one left/right child, which takes its place
+        for node, parent, link, prefix_length in reversed(path):
+            was_dead = node is not current_node and prefix_length == 0 and \
+                node.end_word == False and node.middle == None
+            is_dead = node.end_word == False and node.middle == None
+
+            if is_dead and parent != None and (node.left == None or node.right == None):
+                child = node.left if node.left != None else node.right
+                setattr(parent, link, child)
+                self.node_count -= 1
+                self.reclaimed_nodes += 1
+                if was_dead:
+                    self.dead_nodes -= 1
+                continue
+
+            if is_dead and not was_dead:
+                self.dead_nodes += 1
+            _refresh_max_frequency(node)
+            if prefix_length > 0 and any(cached_word == word for cached_word, _ in node.top_words):
+                _refresh_top_words(node, word[:prefix_length])
+
+        if self.dead_nodes > self.compact_ratio * self.node_count:
+            self.compact()
         return True # word deleted
-        
+
+    def update_frequency(self, word: str, delta: int) -> bool:
+        """
+        change the frequency of a word by 'delta', the word is deleted when its frequency drops to 0 or below.
+        Only the nodes on the path of the word are fixed: on an increase their caches and bounds take the
+        new frequency directly, on a decrease they are recomputed bottom-up from their children.
+        @param word: word to be updated
+        @param delta: amount added to the frequency, can be negative
+        @return: whether succeeded, e.g. return False when word not found
+        """
+
+        frequency = self.search(word)
+        if frequency == 0:
+            return False # given word not present in the dictionary
+        frequency += delta
+        if frequency <= 0:
+            return self.delete_word(word)
+
+        # every node visited, with the length of the prefix ending at it (0 when the letter was not matched)
+        current_node = self.tst
+        path = []
+        i = 0
+        while True:
+            letter = word[i]
+            if letter < current_node.letter:
+                path.append((current_node, 0))
+                current_node = current_node.left
+            elif letter > current_node.letter:
+                path.append((current_node, 0))
+                current_node = current_node.right
+            else:
+                i += 1
+                path.append((current_node, i))
+                if i == len(word):
+                    break
+                current_node = current_node.middle
+
+        current_node.frequency = frequency
+        for node, prefix_length in reversed(path):
+            if delta > 0:
+                if node.max_frequency < frequency:
+                    node.max_frequency = frequency
+            else:
+                _refresh_max_frequency(node)
+            if prefix_length == 0:
+                continue
+
+            cached = [i for i in node.top_words if i[0] != word]
+            if len(cached) == len(node.top_words):
+                if delta > 0:
+                    _offer_top_word(node, word, frequency)
+            elif delta >= 0:
+                node.top_words = sorted(cached + [(word, frequency)], key=_rank)
+            else:
+                _refresh_top_words(node, word[:prefix_length]) # an uncached word may now beat it
+        self.modifications += 1
+        return True # word updated
+
+    def compact(self) -> int:
+        """
+        rebuild the tree from its words, dropping every dead node and rebalancing the left/right links
+        @return: number of nodes reclaimed
+        """
+
+        old_node_count = self.node_count
+        self.build_dictionary(self._all_words())
+        reclaimed = old_node_count - self.node_count
+        self.reclaimed_nodes += reclaimed
+        return reclaimed
+
+    def save(self, path: str):
+        """
+        write the tree to a binary snapshot file as a flat node table, nodes numbered breadth-first
+        @param path: file to be written
+        """
+
+        columns = [array(typecode) for _, typecode in tst_snapshot.COLUMNS]
+        letters, frequencies, end_words, lefts, middles, rights, max_frequencies = columns
+        nodes = [self.tst] if self.tst.letter != None else []
+        node_id = 0
+        while node_id < len(nodes):
+            node = nodes[node_id]
+            letters.append(ord(node.letter))
+            frequencies.append(node.frequency if node.end_word else 0)
+            end_words.append(1 if node.end_word else 0)
+            max_frequencies.append(node.max_frequency)
+            for child, links in ((node.left, lefts), (node.middle, middles), (node.right, rights)):
+                if child == None:
+                    links.append(-1)
+                else:
+                    links.append(len(nodes))
+                    nodes.append(child)
+            node_id += 1
+
+        tst_snapshot.save_columns(path, 0 if nodes else -1, columns)
+
+    @staticmethod
+    def load(path: str) -> BaseDictionary:
+        """
+        map a snapshot file written by save. The node table is searched straight from the mapping,
+        so loading costs no parsing and processes loading the same file share its pages.
+        @param path: snapshot file
+        @return: an ArrayTernarySearchTreeDictionary over the mapped node table
+        """
+        # imported here as the array-backed tree builds on this module
+        from dictionary.arrayternarysearchtree_dictionary import ArrayTernarySearchTreeDictionary
+        return ArrayTernarySearchTreeDictionary.load(path)
+
+    def _clear(self):
+        """
+        reset to an empty tree, a blank root whose letter is set by the first word added
+        """
+        self.tst = TopWordsNode() # creating a Node object
+        self.node_count = 1
+        # nodes that neither end a word nor have a middle child, they only route left/right
+        self.dead_nodes = 1
+
+    def _new_node(self) -> TopWordsNode:
+        """
+        create a node, counted as dead until it ends a word or gets a middle child
+        @return: the new node
+        """
+        self.node_count += 1
+        self.dead_nodes += 1
+        return TopWordsNode()
+
+    def _all_words(self) -> List[WordFrequency]:
+        """
+        @return: every word stored in the tree with its frequency
+        """
+
+        word_li = []
+        stack = [(self.tst, '')] # (node, prefix before the node letter)
+        while stack:
+            node, prefix = stack.pop()
+            if node == None or node.letter == None:
+                continue
+            if node.end_word:
+                word_li.append(WordFrequency(prefix + node.letter, node.frequency))
+            stack.append((node.left, prefix))
+            stack.append((node.middle, prefix + node.letter))
+            stack.append((node.right, prefix))
+        return word_li
+
     def autocomplete(self, word: str) -> List[WordFrequency]:
         """
         return a list of 3 most-frequent words in the dictionary that have 'word' as a prefix
         @param word: word to be autocompleted
         @return: a list (could be empty) of (at most) 3 most-frequent words with prefix 'word'
         """
-       
-        current_node = self.tst 
-        word_length = len(word) 
+
+        if word == '':
+            return self.autocomplete_top_k(word, TOP_K) # the top words of the root only cover its letter
+
+        current_node = self._find_prefix_node(word) # None on an empty tree
+        if current_node == None:
+            return [] # returning an empty list as word not found
+
+        # the words with this prefix are cached on the node, most frequent first
+        return [WordFrequency(cached_word, frequency) for cached_word, frequency in current_node.top_words]
+
+    def autocomplete_top_k(self, word: str, k: int) -> List[WordFrequency]:
+        """
+        return a list of the k most-frequent words in the dictionary that have 'word' as a prefix.
+        Subtrees are explored best-first by their highest frequency and the search stops as soon as
+        k words beat every subtree still waiting in the heap.
+        @param word: word to be autocompleted
+        @param k: number of words wanted
+        @return: a list (could be empty) of (at most) k most-frequent words with prefix 'word'
+        """
+
+        if k <= 0:
+            return []
+        if word == '':
+            # every word has the empty prefix, the whole tree is searched from its root
+            return self._best_first([], k, [(self.tst, '')] if self.tst.letter != None else [])
+
+        current_node = self._find_prefix_node(word)
+        if current_node == None:
+            return []
+        if k <= TOP_K:
+            return [WordFrequency(cached_word, frequency) for cached_word, frequency in current_node.top_words[:k]]
+
+        return self._best_first([(current_node, word)], k)
+
+    def fuzzy_autocomplete(self, word: str, max_distance: int = 1, k: int = 3) -> List[WordFrequency]:
+        """
+        return a list of the k most-frequent words in the dictionary that start with a prefix within
+        'max_distance' edits (insertions, deletions or substitutions) of 'word'.
+        The tree is walked with one Levenshtein DP row per node: a branch is dropped as soon as every
+        entry of its row exceeds the bound, and a node whose row ends within the bound is a match,
+        its whole middle subtree qualifies and is handed to the best-first top-k search.
+        @param word: the possibly misspelt prefix
+        @param max_distance: largest number of edits allowed
+        @param k: number of words wanted
+        @return: a list (could be empty) of (at most) k most-frequent words matching 'word' within the bound
+        """
+
+        if k <= 0 or self.tst.letter == None:
+            return []
+
+        word_length = len(word)
+        matched_nodes = [] # (node, prefix ending at the node) whose prefix is within the bound
+        # (node, prefix before the node letter, DP row of that prefix against 'word')
+        stack = [(self.tst, '', list(range(word_length + 1)))]
+        while stack:
+            node, prefix, previous_row = stack.pop()
+            for sibling in (node.left, node.right):
+                if sibling != None and sibling.max_frequency > 0:
+                    stack.append((sibling, prefix, previous_row))
+
+            letter = node.letter
+            row = [previous_row[0] + 1]
+            for j in range(1, word_length + 1):
+                row.append(min(previous_row[j] + 1, row[j - 1] + 1,
+                               previous_row[j - 1] + (0 if word[j - 1] == letter else 1)))
+
+            if row[word_length] <= max_distance:
+                matched_nodes.append((node, prefix + letter))
+            elif min(row) <= max_distance and node.middle != None and node.middle.max_frequency > 0:
+                stack.append((node.middle, prefix + letter, row))
+
+        return self._best_first(matched_nodes, k)
+
+    def autocomplete_session(self) -> AutocompleteSession:
+        """
+        start a keystroke session that keeps the node of every letter typed, so that a new letter only
+        searches the left/right links below the previous one and backspace drops the last node
+        @return: a session with an empty prefix
+        """
+        return TernarySearchTreeSession(self)
+
+    def _best_first(self, roots: list, k: int, subtrees: list = ()) -> List[WordFrequency]:
+        """
+        return the k most-frequent words found at or below the middle of some nodes.
+        Subtrees are explored best-first by their highest frequency and the search stops as soon as
+        k words beat every subtree still waiting in the heap.
+        @param roots: list of (node, prefix ending at the node), none of them below another's middle
+        @param k: number of words wanted
+        @param subtrees: list of (node, prefix before the node) searched whole, left and right included
+        @return: a list (could be empty) of (at most) k most-frequent words
+        """
+
+        # heap entries are (-bound, 0, order, node, prefix) for subtrees and (-frequency, 1, word) for words,
+        # so at equal value subtrees get expanded first and words come out alphabetically
+        heap = []
+        order = 0
+        for root, word in roots:
+            if root.end_word:
+                heapq.heappush(heap, (-root.frequency, 1, word))
+            if root.middle != None:
+                order += 1
+                heapq.heappush(heap, (-root.middle.max_frequency, 0, order, root.middle, word))
+        for node, prefix in subtrees:
+            if node.max_frequency > 0:
+                order += 1
+                heapq.heappush(heap, (-node.max_frequency, 0, order, node, prefix))
+
+        word_li = []
+        while heap and len(word_li) < k:
+            entry = heapq.heappop(heap)
+            if entry[1] == 1:
+                word_li.append(WordFrequency(entry[2], -entry[0]))
+                continue
+
+            node, prefix = entry[3], entry[4]
+            if node.end_word:
+                heapq.heappush(heap, (-node.frequency, 1, prefix + node.letter))
+            for child, child_prefix in ((node.left, prefix), (node.middle, prefix + node.letter), (node.right, prefix)):
+                if child != None and child.max_frequency > 0:
+                    order += 1
+                    heapq.heappush(heap, (-child.max_frequency, 0, order, child, child_prefix))
+
+        return word_li
+
+    def _find_prefix_node(self, word: str) -> Node:
+        """
+        descend the tree along a prefix
+        @param word: the prefix to be followed
+        @return: the node holding the last letter of 'word', or None when no word has this prefix
+        """
+
+        current_node = self.tst if self.tst.letter != None else None # an empty tree has a blank root
+        word_length = len(word)
         i = 0
         while i < word_length and current_node != None:
             letter = word[i]
@@ -149,58 +617,59 @@ class TernarySearchTreeDictionary(BaseDictionary):
                 current_node = current_node.left
             # traversing to the the middle node
             elif letter == current_node.letter:
-                i += 1 
+                i += 1
                 if i < word_length:
                     current_node = current_node.middle
             # traversing to the right node
             else:
                 current_node = current_node.right
 
-        if i < word_length or current_node == None:
-            return [] # returning an empty list as word not found
+        if i < word_length:
+            return None
+        return current_node
 
-        word_li= [] 
-        word_li.append([current_node, word, current_node.frequency, current_node.end_word]) 
-        i = 0
-        while i != len(word_li):
-            current_node, current_word = word_li[i][0], word_li[i][1] # storing current node and the current word
-            for j in {current_node.left, current_node.middle, current_node.right}:
-                li_element = None
-                # if node is present
-                if j != None:
-                    # traversing the left or right side of the tree
-                    if j == current_node.left or j == current_node.right:
-                        li_element = [j, current_word[:-1] + j.letter, j.frequency, j.end_word]
-                        if i > 0 and li_element not in word_li:
-                            word_li.append(li_element)
-                    # if the node is in the middle
-                    else:
-                        li_element = [j, current_word + j.letter, j.frequency, j.end_word]
-                        word_li.append(li_element)
-            i += 1
-
-        temp_li = [] 
-        # going through the word_li
-        for word in word_li:
-            frequency, end_word = word[2], word[3] 
-            if frequency != None and end_word == True:
-                temp_li.append(word)
-        word_li = temp_li
-
-        # removing current node from the word_li
-        i = 0
-        while i < len(word_li):
-            word_li[i] = word_li[i][1:]
-            i = i + 1
-
-        # if word exists
-        if word_li != []:
-            word_li.sort(key=lambda x: x[1], reverse=True) # sorting in descending order of frequency
-            word_li = word_li[:3] 
-            i = 0
-            while i< len(word_li):
-                # creating WordFrequency and storing words with top three freq in the word_li
-                word_li[i] = WordFrequency(word_li[i][0], word_li[i][1]) 
-                i = i + 1
 
-        return word_li
\ No newline at end of file
+class TernarySearchTreeSession(AutocompleteSession):
+
+    def __init__(self, dictionary: TernarySearchTreeDictionary):
+        """
+        @param dictionary: the tree to be autocompleted from
+        """
+        super().__init__(dictionary)
+        self._restart()
+
+    def _restart(self):
+        """
+        find the nodes of the current prefix again, after the tree was changed
+        """
+        self.modifications = self.dictionary.modifications
+        self.nodes = [] # node holding each letter of the prefix, None from the first letter not in the tree
+        for letter in self.prefix:
+            self._push_letter(letter)
+
+    def results(self) -> List[WordFrequency]:
+        """
+        @return: a list (could be empty) of (at most) 3 most-frequent words with the current prefix
+        """
+        self._refresh()
+        if not self.nodes:
+            return self.dictionary.autocomplete('')
+        if self.nodes[-1] == None:
+            return [] # prefix not in the tree
+        return [WordFrequency(cached_word, frequency) for cached_word, frequency in self.nodes[-1].top_words]
+
+    def _refresh(self):
+        if self.modifications != self.dictionary.modifications:
+            self._restart()
+
+    def _push_letter(self, letter: str):
+        if self.nodes:
+            current_node = self.nodes[-1].middle if self.nodes[-1] != None else None
+        else:
+            current_node = self.dictionary.tst if self.dictionary.tst.letter != None else None
+        while current_node != None and letter != current_node.letter:
+            current_node = current_node.left if letter < current_node.letter else current_node.right
+        self.nodes.append(current_node)
+
+    def _pop_letter(self):
+        self.nodes.pop()
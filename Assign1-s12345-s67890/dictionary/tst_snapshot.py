@@ -0,0 +1,85 @@
+import mmap
+import struct
+import sys
+from array import array
+
+
+# ------------------------------------------------------------------------
+# Binary snapshot of a Ternary Search Tree node table.
+#
+# The file is a fixed header followed by the node columns of
+# ArrayTernarySearchTreeDictionary, each stored as raw machine values and
+# padded to 8 bytes. Loading maps the file and casts every column in place,
+# so nothing is parsed or copied and processes mapping the same file share
+# its pages.
+#
+# header: magic (8 bytes), byte order (8 bytes), node count (8), root ID (8)
+# ------------------------------------------------------------------------
+
+MAGIC = b'TSTSNAP1'
+HEADER = struct.Struct('=8s8sqq')
+
+# (attribute name, array typecode) of every column, in file order
+COLUMNS = [
+    ('letters', 'I'),
+    ('frequencies', 'q'),
+    ('end_words', 'b'),
+    ('lefts', 'i'),
+    ('middles', 'i'),
+    ('rights', 'i'),
+    ('max_frequencies', 'q'),
+]
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+def is_snapshot(path: str) -> bool:
+    """
+    @param path: file to be checked
+    @return: True if the file starts like a snapshot
+    """
+    with open(path, 'rb') as snapshot_file:
+        return snapshot_file.read(len(MAGIC)) == MAGIC
+
+
+def save_columns(path: str, root: int, columns: list):
+    """
+    write a node table to a snapshot file
+    @param path: file to be written
+    @param root: ID of the root node
+    @param columns: one array (or memoryview) per entry of COLUMNS, all of the same length
+    """
+    node_count = len(columns[0])
+    with open(path, 'wb') as snapshot_file:
+        snapshot_file.write(HEADER.pack(MAGIC, sys.byteorder.encode().ljust(8, b'\0'), node_count, root))
+        for column, (_, typecode) in zip(columns, COLUMNS):
+            data = memoryview(column).cast('B')
+            snapshot_file.write(data)
+            snapshot_file.write(b'\0' * _padding(len(data)))
+
+
+def load_columns(path: str):
+    """
+    map a snapshot file read-only
+    @param path: file to be mapped
+    @return: (root ID, list of memoryview columns in COLUMNS order, the mapping that backs them)
+    """
+    with open(path, 'rb') as snapshot_file:
+        mapping = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, byteorder, node_count, root = HEADER.unpack_from(mapping)
+    if magic != MAGIC:
+        raise ValueError(f"'{path}' is not a ternary search tree snapshot")
+    if byteorder.rstrip(b'\0').decode() != sys.byteorder:
+        raise ValueError(f"'{path}' was written on a machine with a different byte order")
+
+    view = memoryview(mapping)
+    columns = []
+    offset = HEADER.size
+    for _, typecode in COLUMNS:
+        size = node_count * array(typecode).itemsize
+        columns.append(view[offset:offset + size].cast(typecode))
+        offset += size + _padding(size)
+    return root, columns, mapping
@@ -1,10 +1,11 @@
 import sys
-from dictionary.node import Node
-from dictionary.word_frequency import WordFrequency
 from dictionary.base_dictionary import BaseDictionary
-from dictionary.list_dictionary import ListDictionary
-from dictionary.hashtable_dictionary import HashTableDictionary
 from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+from dictionary.approaches import make_dictionary
+from dictionary.tst_snapshot import is_snapshot
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.command_executor import run_commands
+from dictionary.parallel_executor import run_parallel
 
 
 # -------------------------------------------------------------------
@@ -22,8 +23,11 @@ def usage():
     """
     Print help/usage message.
     """
-    print('python3 dictionary_file_based.py', '<approach> [data fileName] [command fileName] [output fileName]')
-    print('<approach> = <list | hashtable | tst>')
+    print('python3 dictionary_file_based.py', '<approach> [data fileName] [command fileName] [output fileName]',
+          '[number of processes]')
+    print('<approach> = <list | sortedlist | columnarlist | hashtable | openhash | tst | arraytst | radixtst>')
+    print('for tst and arraytst the data file can also be a snapshot written by tst_snapshot_tool.py')
+    print('with more than 1 process (default 1) the words are split into shards run in parallel')
     sys.exit(1)
 
 
@@ -31,35 +35,37 @@ if __name__ == '__main__':
     # Fetch the command line arguments
     args = sys.argv
 
-    if len(args) != 5:
+    if len(args) not in [5, 6]:
         print('Incorrect number of arguments.')
         usage()
 
+    process_count = 1
+    if len(args) == 6:
+        if not args[5].isdigit() or int(args[5]) < 1:
+            print('Incorrect argument value.')
+            usage()
+        process_count = int(args[5])
+
     # initialise search agent
-    agent: BaseDictionary = None
-    if args[1] == 'list':
-        agent = ListDictionary()
-    elif args[1] == 'hashtable':
-        agent = HashTableDictionary()
-    elif args[1] == 'tst':
-        agent = TernarySearchTreeDictionary()
-    else:
+    agent: BaseDictionary = make_dictionary(args[1])
+    if agent == None:
         print('Incorrect argument value.')
         usage()
 
     # read from data file to populate the initial set of points
     data_filename = args[2]
-    words_frequencies_from_file = []
     try:
-        data_file = open(data_filename, 'r')
-        for line in data_file:
-            values = line.split()
-            word = values[0]
-            frequency = int(values[1])
-            word_frequency = WordFrequency(word, frequency)  # each line contains a word and its frequency
-            words_frequencies_from_file.append(word_frequency)
-        data_file.close()
-        agent.build_dictionary(words_frequencies_from_file)
+        if process_count > 1:
+            # every process builds its own shard from the data file
+            if is_snapshot(data_filename):
+                print('A snapshot cannot be split into shards, use the data file.')
+                usage()
+        elif args[1] in ['tst', 'arraytst'] and is_snapshot(data_filename):
+            # a snapshot is mapped and searched in place, there is nothing to build
+            agent = TernarySearchTreeDictionary.load(data_filename)
+        else:
+            # the file is parsed in bulk into a column of words and a column of frequencies
+            build_from_columns(agent, *read_columns(data_filename))
     except FileNotFoundError as e:
         print("Data file doesn't exist.")
         usage()
@@ -71,47 +77,12 @@ if __name__ == '__main__':
         command_file = open(command_filename, 'r')
         output_file = open(output_filename, 'w')
 
-        for line in command_file:
-            command_values = line.split()
-            command = command_values[0]
-            # search
-            if command == 'S':
-                word = command_values[1]
-                search_result = agent.search(word)
-                if search_result > 0:
-                    output_file.write(f"Found '{word}' with frequency {search_result}\n")
-                else:
-                    output_file.write(f"NOT Found '{word}'\n")
-
-            # add
-            elif command == 'A':
-                word = command_values[1]
-                frequency = int(command_values[2])
-                word_frequency = WordFrequency(word, frequency)
-                if not agent.add_word_frequency(word_frequency):
-                    output_file.write(f"Add '{word}' failed\n")
-                else:
-                    output_file.write(f"Add '{word}' succeeded\n")
-
-            # delete
-            elif command == 'D':
-                word = command_values[1]
-                if not agent.delete_word(word):
-                    output_file.write(f"Delete '{word}' failed\n")
-                else:
-                    output_file.write(f"Delete '{word}' succeeded\n")
-
-            # check
-            elif command == 'AC':
-                word = command_values[1]
-                list_words = agent.autocomplete(word)
-                line = "Autocomplete for '" + word + "': [ "
-                for item in list_words:
-                    line = line + item.word + ": " + str(item.frequency) + "  "
-                output_file.write(line + ']\n')
-            else:
-                print('Unknown command.')
-                print(line)
+        if process_count > 1:
+            # the processes replay the command file on their shards, their answers are stitched back in order
+            run_parallel(agent, data_filename, command_filename, output_file, process_count)
+        else:
+            # commands are dispatched inline and their output is written in blocks
+            run_commands(agent, command_file, output_file)
 
         output_file.close()
         command_file.close()
@@ -0,0 +1,102 @@
+import asyncio
+import random
+import sys
+import timeit
+from collections import deque
+
+from dictionary.data_loader import read_columns
+from dictionary.command_server import open_connection
+
+
+# -------------------------------------------------------------------
+# Load generator for dictionary_server.py. Opens a number of concurrent
+# connections, each sending searches and autocompletes of words from the
+# data file with up to 'pipeline depth' commands waiting for their
+# answers, and reports the throughput and the p50/p99 latency of a
+# command (from sending it to receiving its answer).
+#
+# python3 dictionary_load_client.py [address] [data fileName] [number of connections]
+#                                   [commands per connection] [pipeline depth]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 dictionary_load_client.py', '[address] [data fileName] [number of connections]',
+          '[commands per connection] [pipeline depth]')
+    print('<address> = <HOST:PORT | unix:PATH>')
+    sys.exit(1)
+
+
+def make_commands(words, count):
+    commands = []
+    for _ in range(count):
+        word = random.choice(words)
+        if random.random() < 0.5:
+            commands.append(f'S {word}\n'.encode())
+        else:
+            commands.append(f'AC {word[:random.randint(1, 4)]}\n'.encode())
+    return commands
+
+
+async def run_connection(address, commands, depth, latencies):
+    """
+    send the commands keeping at most 'depth' of them unanswered, recording the latency of each
+    """
+    reader, writer = await open_connection(address)
+    sent_times = deque()
+    sent = 0
+    while sent < len(commands) and sent < depth:
+        writer.write(commands[sent])
+        sent_times.append(timeit.default_timer())
+        sent += 1
+    await writer.drain()
+
+    for _ in range(len(commands)):
+        await reader.readline()
+        latencies.append(timeit.default_timer() - sent_times.popleft())
+        if sent < len(commands):
+            writer.write(commands[sent])
+            sent_times.append(timeit.default_timer())
+            sent += 1
+            await writer.drain()
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(address, words, connection_count, command_count, depth):
+    latencies = []
+    initial_time = timeit.default_timer()
+    await asyncio.gather(*[run_connection(address, make_commands(words, command_count), depth, latencies)
+                           for _ in range(connection_count)])
+    return timeit.default_timer() - initial_time, latencies
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[int(fraction * (len(sorted_values) - 1))]
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 6:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words = read_columns(args[2])[0]
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    elapsed, latencies = asyncio.run(run_load(args[1], words, int(args[3]), int(args[4]), int(args[5])))
+    latencies.sort()
+
+    for title in ['Commands', 'Time (s)', 'Commands/s', 'p50 latency (ms)', 'p99 latency (ms)']:
+        print(title.ljust(20), end='')
+    print()
+    print(format(len(latencies)).ljust(20) + format(elapsed, '5f').ljust(20)
+          + format(len(latencies) / elapsed, '.0f').ljust(20)
+          + format(percentile(latencies, 0.5) * 1000, '.3f').ljust(20)
+          + format(percentile(latencies, 0.99) * 1000, '.3f'))
@@ -0,0 +1,55 @@
+import asyncio
+import sys
+from dictionary.base_dictionary import BaseDictionary
+from dictionary.approaches import make_dictionary
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.command_server import start_server
+
+
+# -------------------------------------------------------------------
+# Serves a dictionary over TCP or a Unix domain socket with the command
+# line protocol of command files: one command per line (S, A, D, U, AC),
+# one answer line per command, in the format dictionary_file_based.py
+# writes. The dictionary is built once from the data file at start-up.
+#
+# python3 dictionary_server.py <approach> [data fileName] [address]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 dictionary_server.py', '<approach> [data fileName] [address]')
+    print('<approach> = <list | sortedlist | columnarlist | hashtable | openhash | tst | arraytst | radixtst>')
+    print('<address> = <HOST:PORT | unix:PATH>')
+    sys.exit(1)
+
+
+async def serve(agent: BaseDictionary, address: str):
+    server = await start_server(agent, address)
+    print('Serving on', address)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 4:
+        print('Incorrect number of arguments.')
+        usage()
+
+    agent: BaseDictionary = make_dictionary(args[1])
+    if agent == None:
+        print('Incorrect argument value.')
+        usage()
+
+    try:
+        build_from_columns(agent, *read_columns(args[2]))
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    try:
+        asyncio.run(serve(agent, args[3]))
+    except KeyboardInterrupt:
+        pass
@@ -94,7 +94,7 @@ def main():
     lsInFile = remainArgs[3:]
 
     # check implementation
-    setValidImpl = set(["list", "hashtable", "tst"])
+    setValidImpl = set(["list", "sortedlist", "columnarlist", "hashtable", "openhash", "tst", "arraytst", "radixtst"])
     if sImpl not in setValidImpl:
         print(sImpl + " is not a valid implementation name.")
         sys.exit(1)
@@ -0,0 +1,97 @@
+import sys
+import timeit
+import tracemalloc
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.openaddressing_dictionary import OpenAddressingDictionary
+
+
+# -------------------------------------------------------------------
+# Compares HashTableDictionary, with and without its prefix index, with
+# the open-addressing table: memory held by the built table (words
+# included), time to read and build, the time to search and then delete
+# every word of the data file and the time to autocomplete 50 two-letter
+# prefixes.
+#
+# python3 hashtable_memory_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 hashtable_memory_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def measure(agent, data_filename, prefixes):
+    # the data file is read inside the trace so that the table owns its words,
+    # the parsed list is dropped before measuring
+    tracemalloc.start()
+    initial_time = timeit.default_timer()
+    agent.build_dictionary(read_data_file(data_filename))
+    build_time = timeit.default_timer() - initial_time
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    words_frequencies = read_data_file(data_filename)
+
+    initial_time = timeit.default_timer()
+    for word_frequency in words_frequencies:
+        agent.search(word_frequency.word)
+    search_time = timeit.default_timer() - initial_time
+
+    initial_time = timeit.default_timer()
+    for prefix in prefixes:
+        agent.autocomplete(prefix)
+    autocomplete_time = timeit.default_timer() - initial_time
+
+    initial_time = timeit.default_timer()
+    for word_frequency in words_frequencies:
+        agent.delete_word(word_frequency.word)
+    delete_time = timeit.default_timer() - initial_time
+
+    return [memory / (1024 * 1024), build_time, search_time, autocomplete_time, delete_time]
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words_frequencies = read_data_file(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    prefixes = sorted({word_frequency.word[:2] for word_frequency in words_frequencies})[:50]
+    word_count = len(words_frequencies)
+    del words_frequencies
+
+    print(f'{word_count} words, {len(prefixes)} two-letter prefixes\n')
+    for title in ['Implementation', 'Memory (MB)', 'Read + build (s)', 'Search all (s)', 'Autocomplete (s)', 'Delete all (s)']:
+        print(title.ljust(20), end='')
+    print()
+
+    agents = [
+        ('hashtable', HashTableDictionary()),
+        ('hashtable no index', HashTableDictionary(prefix_index_length=0)),
+        ('openhash', OpenAddressingDictionary()),
+    ]
+    for name, agent in agents:
+        print(name.ljust(20), end='')
+        for value in measure(agent, args[1], prefixes):
+            print(format(value, '5f').ljust(20), end='')
+        print()
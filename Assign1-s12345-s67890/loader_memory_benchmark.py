@@ -0,0 +1,77 @@
+import sys
+import timeit
+import tracemalloc
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.list_dictionary import ListDictionary
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+from dictionary.data_loader import read_words_frequencies
+
+
+# -------------------------------------------------------------------
+# Compares building each dictionary from a list holding the whole data
+# file with building it straight from the streaming loader: peak memory
+# during the build, memory held by the finished dictionary, and time.
+#
+# python3 loader_memory_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 loader_memory_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def measure(make, data_filename, streaming):
+    """
+    @return: [peak MB, held MB, seconds] of one build
+    """
+    tracemalloc.start()
+    initial_time = timeit.default_timer()
+    agent = make()
+    if streaming:
+        agent.build_dictionary(read_words_frequencies(data_filename))
+    else:
+        agent.build_dictionary(read_data_file(data_filename))
+    elapsed = timeit.default_timer() - initial_time
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return [peak / 2 ** 20, held / 2 ** 20, elapsed]
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        open(args[1]).close()
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    for title in ['Approach', 'Loading', 'Peak (MB)', 'Held (MB)', 'Time (s)']:
+        print(title.ljust(20), end='')
+    print()
+
+    for approach, make in [('list', ListDictionary), ('hashtable', HashTableDictionary),
+                           ('tst', TernarySearchTreeDictionary)]:
+        for loading, streaming in [('whole list', False), ('streaming', True)]:
+            row = measure(make, args[1], streaming)
+            print(approach.ljust(20) + loading.ljust(20), end='')
+            for value in row:
+                print(format(value, '.2f').ljust(20), end='')
+            print()
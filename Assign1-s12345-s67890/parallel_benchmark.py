@@ -0,0 +1,112 @@
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+from dictionary.list_dictionary import ListDictionary
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.command_executor import run_commands
+from dictionary.parallel_executor import run_parallel
+
+
+# -------------------------------------------------------------------
+# Runs a generated command file (searches, adds, deletes, updates and
+# autocompletes of words from the data file), build included, serially
+# and with the words split over 2, 4, ... up to the given number of
+# processes, and checks that every run writes the same output.
+#
+# python3 parallel_benchmark.py <approach> [data fileName] [number of commands] [max number of processes]
+# -------------------------------------------------------------------
+
+APPROACHES = {'list': lambda: ListDictionary(sorted_mode=True), 'hashtable': HashTableDictionary,
+              'tst': TernarySearchTreeDictionary}
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 parallel_benchmark.py', '<approach> [data fileName] [number of commands] [max number of processes]')
+    print('<approach> = <list | hashtable | tst>')
+    sys.exit(1)
+
+
+def make_commands(words, count):
+    lines = []
+    for _ in range(count):
+        word = random.choice(words)
+        command = random.choice(['S', 'S', 'S', 'A', 'D', 'U', 'AC'])
+        if command == 'A':
+            lines.append(f'A {word} {random.randint(1, 1000)}\n')
+        elif command == 'U':
+            lines.append(f'U {word} {random.randint(-100, 1000)}\n')
+        elif command == 'AC':
+            lines.append(f'AC {word[:random.randint(1, 4)]}\n')
+        else:
+            lines.append(f'{command} {word}\n')
+    return lines
+
+
+def run_serial(make, data_filename, command_filename, output_filename):
+    initial_time = timeit.default_timer()
+    agent = make()
+    build_from_columns(agent, *read_columns(data_filename))
+    with open(command_filename, 'r') as command_file, open(output_filename, 'w') as output_file:
+        run_commands(agent, command_file, output_file)
+    return timeit.default_timer() - initial_time
+
+
+def run_sharded(make, data_filename, command_filename, output_filename, process_count):
+    initial_time = timeit.default_timer()
+    with open(output_filename, 'w') as output_file:
+        run_parallel(make(), data_filename, command_filename, output_file, process_count)
+    return timeit.default_timer() - initial_time
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 5:
+        print('Incorrect number of arguments.')
+        usage()
+    if args[1] not in APPROACHES:
+        print('Incorrect argument value.')
+        usage()
+
+    try:
+        words = read_columns(args[2])[0]
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+    command_count = int(args[3])
+    max_process_count = int(args[4])
+
+    work_dir = tempfile.mkdtemp()
+    command_filename = os.path.join(work_dir, 'commands.in')
+    with open(command_filename, 'w') as command_file:
+        command_file.writelines(make_commands(words, command_count))
+
+    for title in ['Processes', 'Time (s)', 'Speed-up']:
+        print(title.ljust(25), end='')
+    print()
+
+    serial_output = os.path.join(work_dir, 'serial.out')
+    serial_time = run_serial(APPROACHES[args[1]], args[2], command_filename, serial_output)
+    print('1 (serial)'.ljust(25) + format(serial_time, '5f').ljust(25) + '1.00')
+
+    process_count = 2
+    while process_count <= max_process_count:
+        sharded_output = os.path.join(work_dir, 'sharded.out')
+        sharded_time = run_sharded(APPROACHES[args[1]], args[2], command_filename, sharded_output, process_count)
+        with open(serial_output, 'rb') as serial_file, open(sharded_output, 'rb') as sharded_file:
+            assert serial_file.read() == sharded_file.read(), 'the outputs differ'
+        print(format(process_count).ljust(25) + format(sharded_time, '5f').ljust(25)
+              + format(serial_time / sharded_time, '.2f'))
+        os.remove(sharded_output)
+        process_count *= 2
+
+    for filename in [command_filename, serial_output]:
+        os.remove(filename)
+    os.rmdir(work_dir)
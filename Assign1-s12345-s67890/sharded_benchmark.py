@@ -0,0 +1,97 @@
+import random
+import sys
+import timeit
+
+from dictionary.approaches import make_dictionary
+from dictionary.data_loader import read_columns, build_from_columns
+from dictionary.sharded_dictionary import ShardedDictionary
+
+
+# -------------------------------------------------------------------
+# Builds the data file into one dictionary and into a ShardedDictionary
+# of the same approach, routed by hash and by first letter, with the
+# shards in this process and in worker processes, and reports the build
+# time and the mean time of a search and of an autocomplete for each.
+# The autocompletes of every sharded dictionary are checked against the
+# single dictionary.
+#
+# python3 sharded_benchmark.py <approach> [data fileName] [number of shards]
+# -------------------------------------------------------------------
+
+QUERIES = 2000
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 sharded_benchmark.py', '<approach> [data fileName] [number of shards]')
+    print('<approach> = <list | sortedlist | columnarlist | hashtable | openhash | tst | arraytst | radixtst>')
+    sys.exit(1)
+
+
+def time_build(agent, words, frequencies):
+    initial_time = timeit.default_timer()
+    build_from_columns(agent, words, frequencies)
+    return timeit.default_timer() - initial_time
+
+
+def time_searches(agent, words):
+    initial_time = timeit.default_timer()
+    for word in words:
+        agent.search(word)
+    return (timeit.default_timer() - initial_time) / len(words)
+
+
+def time_autocompletes(agent, prefixes):
+    answers = []
+    initial_time = timeit.default_timer()
+    for prefix in prefixes:
+        answers.append([(i.word, i.frequency) for i in agent.autocomplete(prefix)])
+    return (timeit.default_timer() - initial_time) / len(prefixes), answers
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 4:
+        print('Incorrect number of arguments.')
+        usage()
+    if make_dictionary(args[1]) == None:
+        print('Incorrect argument value.')
+        usage()
+
+    try:
+        words, frequencies = read_columns(args[2])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+    shard_count = int(args[3])
+
+    search_words = [random.choice(words) for _ in range(QUERIES)]
+    prefixes = [word[:random.randint(1, 4)] for word in random.sample(words, QUERIES)]
+
+    for title in ['Dictionary', 'Build (s)', 'Search (s)', 'Autocomplete (s)']:
+        print(title.ljust(30), end='')
+    print()
+
+    expected_answers = None
+    for name, make in [('single', lambda: make_dictionary(args[1])),
+                       ('hash, in-process', lambda: ShardedDictionary(lambda: make_dictionary(args[1]), shard_count)),
+                       ('first letter, in-process',
+                        lambda: ShardedDictionary(lambda: make_dictionary(args[1]), shard_count, by_first_letter=True)),
+                       ('hash, processes', lambda: ShardedDictionary(lambda: make_dictionary(args[1]), shard_count,
+                                                                     worker_processes=True)),
+                       ('first letter, processes',
+                        lambda: ShardedDictionary(lambda: make_dictionary(args[1]), shard_count, by_first_letter=True,
+                                                  worker_processes=True))]:
+        agent = make()
+        build_time = time_build(agent, words, frequencies)
+        search_time = time_searches(agent, search_words)
+        autocomplete_time, answers = time_autocompletes(agent, prefixes)
+        if expected_answers == None:
+            expected_answers = answers
+        assert answers == expected_answers, 'the autocompletes differ'
+        if isinstance(agent, ShardedDictionary):
+            agent.close()
+        print(name.ljust(30) + format(build_time, '.5f').ljust(30) + format(search_time, '.8f').ljust(30)
+              + format(autocomplete_time, '.8f'))
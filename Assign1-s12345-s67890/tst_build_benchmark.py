@@ -0,0 +1,108 @@
+import sys
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+
+
+# -------------------------------------------------------------------
+# Compares building the Ternary Search Tree one word at a time in file
+# order with the balanced build_dictionary, on the unsorted, ascending
+# and descending versions of the data file. For every tree it reports
+# the build time, the time to search every word and the deepest search
+# path.
+#
+# python3 tst_build_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 tst_build_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def build_in_file_order(agent, words_frequencies):
+    agent.build_dictionary([]) # an empty tree, filled in file order
+    for word_freq in words_frequencies:
+        agent.add_word_frequency(word_freq)
+
+
+def search_depth(agent, word):
+    depth = 0
+    current_node = agent.tst
+    i = 0
+    while current_node != None:
+        depth += 1
+        if word[i] < current_node.letter:
+            current_node = current_node.left
+        elif word[i] > current_node.letter:
+            current_node = current_node.right
+        else:
+            i += 1
+            if i == len(word):
+                break
+            current_node = current_node.middle
+    return depth
+
+
+def measure(build, words_frequencies):
+    agent = TernarySearchTreeDictionary()
+    initial_time = timeit.default_timer()
+    build(agent, words_frequencies)
+    build_time = timeit.default_timer() - initial_time
+
+    initial_time = timeit.default_timer()
+    for word_frequency in words_frequencies:
+        agent.search(word_frequency.word)
+    search_time = timeit.default_timer() - initial_time
+
+    max_depth = max(search_depth(agent, word_frequency.word) for word_frequency in words_frequencies)
+    return [build_time, search_time, max_depth]
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words_frequencies = read_data_file(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    datasets = {
+        'unsorted': words_frequencies,
+        'ascending': sorted(words_frequencies, key=lambda x: x.word),
+        'descending': sorted(words_frequencies, key=lambda x: x.word, reverse=True),
+    }
+    builds = {
+        'file order': build_in_file_order,
+        'balanced': TernarySearchTreeDictionary.build_dictionary,
+    }
+
+    for title in ['Build', 'Input', 'Build (s)', 'Search all (s)', 'Max depth']:
+        print(title.ljust(20), end='')
+    print()
+
+    for build_name, build in builds.items():
+        for dataset_name, dataset in datasets.items():
+            print(build_name.ljust(20) + dataset_name.ljust(20), end='')
+            for value in measure(build, dataset):
+                if isinstance(value, int):
+                    print(format(value).ljust(20), end='')
+                else:
+                    print(format(value, '5f').ljust(20), end='')
+            print()
@@ -0,0 +1,87 @@
+import random
+import sys
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+
+
+# -------------------------------------------------------------------
+# Measures TernarySearchTreeDictionary.fuzzy_autocomplete on prefixes
+# of words from the data file with one random typo, for every prefix
+# length from 2 to 8 and edit distance bounds of 1 and 2. Reports the
+# mean and worst latency per call, next to the exact autocomplete of the
+# same (misspelt) prefixes.
+#
+# python3 tst_fuzzy_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+CALLS_PER_LENGTH = 50
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 tst_fuzzy_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def misspelt_prefixes(words, length):
+    prefixes = []
+    while len(prefixes) < CALLS_PER_LENGTH:
+        word = random.choice(words)
+        if len(word) < length:
+            continue
+        position = random.randint(0, length - 1)
+        prefixes.append(word[:position] + random.choice('abcdefghijklmnopqrstuvwxyz') + word[position + 1:length])
+    return prefixes
+
+
+def latencies(call, prefixes):
+    times = []
+    for prefix in prefixes:
+        initial_time = timeit.default_timer()
+        call(prefix)
+        times.append(timeit.default_timer() - initial_time)
+    return [sum(times) / len(times), max(times)]
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words_frequencies = read_data_file(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    agent = TernarySearchTreeDictionary()
+    agent.build_dictionary(words_frequencies)
+    words = [word_frequency.word for word_frequency in words_frequencies]
+
+    for title in ['Prefix length', 'Exact mean (s)', 'd=1 mean (s)', 'd=1 worst (s)', 'd=2 mean (s)', 'd=2 worst (s)']:
+        print(title.ljust(18), end='')
+    print()
+
+    for length in range(2, 9):
+        prefixes = misspelt_prefixes(words, length)
+        row = [latencies(agent.autocomplete, prefixes)[0]]
+        for max_distance in [1, 2]:
+            row += latencies(lambda prefix: agent.fuzzy_autocomplete(prefix, max_distance), prefixes)
+        print(format(length).ljust(18), end='')
+        for value in row:
+            print(format(value, '5f').ljust(18), end='')
+        print()
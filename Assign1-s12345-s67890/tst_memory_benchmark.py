@@ -0,0 +1,89 @@
+import sys
+import timeit
+import tracemalloc
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+from dictionary.arrayternarysearchtree_dictionary import ArrayTernarySearchTreeDictionary
+from dictionary.radixternarysearchtree_dictionary import RadixTernarySearchTreeDictionary
+
+
+# -------------------------------------------------------------------
+# Compares the object-based Ternary Search Tree with the array-backed
+# node pool and the radix-compressed tree: number of nodes, memory held
+# by the built tree, build time, the time to search every word of the
+# data file and the time to autocomplete every two-letter prefix.
+#
+# python3 tst_memory_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 tst_memory_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def measure(agent, words_frequencies, prefixes):
+    tracemalloc.start()
+    initial_time = timeit.default_timer()
+    agent.build_dictionary(words_frequencies)
+    build_time = timeit.default_timer() - initial_time
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    initial_time = timeit.default_timer()
+    for word_frequency in words_frequencies:
+        agent.search(word_frequency.word)
+    search_time = timeit.default_timer() - initial_time
+
+    initial_time = timeit.default_timer()
+    for prefix in prefixes:
+        agent.autocomplete(prefix)
+    autocomplete_time = timeit.default_timer() - initial_time
+
+    return [agent.node_count, memory / (1024 * 1024), build_time, search_time, autocomplete_time]
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words_frequencies = read_data_file(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    prefixes = sorted({word_frequency.word[:2] for word_frequency in words_frequencies})
+
+    print(f'{len(words_frequencies)} words, {len(prefixes)} two-letter prefixes\n')
+    for title in ['Implementation', 'Nodes', 'Memory (MB)', 'Build (s)', 'Search all (s)', 'Autocomplete (s)']:
+        print(title.ljust(20), end='')
+    print()
+
+    agents = [
+        ('tst', TernarySearchTreeDictionary()),
+        ('arraytst', ArrayTernarySearchTreeDictionary()),
+        ('radixtst', RadixTernarySearchTreeDictionary()),
+    ]
+    for name, agent in agents:
+        print(name.ljust(20), end='')
+        for value in measure(agent, words_frequencies, prefixes):
+            if isinstance(value, int):
+                print(format(value).ljust(20), end='')
+            else:
+                print(format(value, '5f').ljust(20), end='')
+        print()
@@ -0,0 +1,78 @@
+import random
+import sys
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+
+
+# -------------------------------------------------------------------
+# Compares TernarySearchTreeDictionary.search called in a loop with one
+# search_many call, for batches of words drawn from the data file (half
+# of them present, half with a letter changed so that they miss).
+#
+# python3 tst_search_many_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 tst_search_many_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def make_batch(words, size):
+    batch = []
+    while len(batch) < size:
+        word = random.choice(words)
+        if len(batch) % 2 == 1:
+            position = random.randint(0, len(word) - 1)
+            word = word[:position] + random.choice('abcdefghijklmnopqrstuvwxyz') + word[position + 1:]
+        batch.append(word)
+    return batch
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words_frequencies = read_data_file(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    agent = TernarySearchTreeDictionary()
+    agent.build_dictionary(words_frequencies)
+    words = [word_frequency.word for word_frequency in words_frequencies]
+
+    for title in ['Batch size', 'search loop (s)', 'search_many (s)', 'Speed-up']:
+        print(title.ljust(25), end='')
+    print()
+
+    for size in [100, 1000, 10000, 100000]:
+        batch = make_batch(words, size)
+
+        initial_time = timeit.default_timer()
+        loop_results = [agent.search(word) for word in batch]
+        loop_time = timeit.default_timer() - initial_time
+
+        initial_time = timeit.default_timer()
+        batch_results = agent.search_many(batch)
+        batch_time = timeit.default_timer() - initial_time
+
+        assert loop_results == batch_results
+        print(format(size).ljust(25) + format(loop_time, '5f').ljust(25) + format(batch_time, '5f').ljust(25)
+              + format(loop_time / batch_time, '.2f'))
@@ -0,0 +1,59 @@
+import sys
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+
+
+# -------------------------------------------------------------------
+# Builds a Ternary Search Tree from a data file and writes it as a
+# binary snapshot, which dictionary_file_based.py accepts in place of
+# the data file for the tst and arraytst approaches. It then compares
+# the startup time of parsing and building with mapping the snapshot.
+#
+# python3 tst_snapshot_tool.py [data fileName] [snapshot fileName]
+# -------------------------------------------------------------------
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 tst_snapshot_tool.py', '[data fileName] [snapshot fileName]')
+    sys.exit(1)
+
+
+def build_from_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    agent = TernarySearchTreeDictionary()
+    agent.build_dictionary(words_frequencies)
+    return agent
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 3:
+        print('Incorrect number of arguments.')
+        usage()
+
+    data_filename, snapshot_filename = args[1], args[2]
+    try:
+        initial_time = timeit.default_timer()
+        agent = build_from_data_file(data_filename)
+        build_time = timeit.default_timer() - initial_time
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    agent.save(snapshot_filename)
+
+    initial_time = timeit.default_timer()
+    loaded_agent = TernarySearchTreeDictionary.load(snapshot_filename)
+    load_time = timeit.default_timer() - initial_time
+
+    print(f"Snapshot of {loaded_agent.node_count} nodes written to '{snapshot_filename}'")
+    print('Parse and build (s)'.ljust(25) + format(build_time, '5f'))
+    print('Map snapshot (s)'.ljust(25) + format(load_time, '5f'))
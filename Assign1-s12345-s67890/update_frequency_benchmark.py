@@ -0,0 +1,82 @@
+import random
+import sys
+import timeit
+
+from dictionary.word_frequency import WordFrequency
+from dictionary.list_dictionary import ListDictionary
+from dictionary.hashtable_dictionary import HashTableDictionary
+from dictionary.ternarysearchtree_dictionary import TernarySearchTreeDictionary
+
+
+# -------------------------------------------------------------------
+# Applies random frequency increments to words of the data file and
+# compares the mean time per update of update_frequency with a delete
+# followed by an add of the new frequency.
+#
+# python3 update_frequency_benchmark.py [data fileName]
+# -------------------------------------------------------------------
+
+UPDATES = 2000
+
+
+def usage():
+    """
+    Print help/usage message.
+    """
+    print('python3 update_frequency_benchmark.py', '[data fileName]')
+    sys.exit(1)
+
+
+def read_data_file(data_filename):
+    words_frequencies = []
+    with open(data_filename, 'r') as data_file:
+        for line in data_file:
+            values = line.split()
+            words_frequencies.append(WordFrequency(values[0], int(values[1])))
+    return words_frequencies
+
+
+def time_update_frequency(agent, updates):
+    initial_time = timeit.default_timer()
+    for word, delta in updates:
+        agent.update_frequency(word, delta)
+    return (timeit.default_timer() - initial_time) / len(updates)
+
+
+def time_delete_add(agent, updates):
+    initial_time = timeit.default_timer()
+    for word, delta in updates:
+        frequency = agent.search(word)
+        agent.delete_word(word)
+        agent.add_word_frequency(WordFrequency(word, frequency + delta))
+    return (timeit.default_timer() - initial_time) / len(updates)
+
+
+if __name__ == '__main__':
+    args = sys.argv
+    if len(args) != 2:
+        print('Incorrect number of arguments.')
+        usage()
+
+    try:
+        words_frequencies = read_data_file(args[1])
+    except FileNotFoundError as e:
+        print("Data file doesn't exist.")
+        usage()
+
+    updates = [(random.choice(words_frequencies).word, random.randint(1, 1000)) for _ in range(UPDATES)]
+
+    for title in ['Approach', 'Delete + add (s)', 'update_frequency (s)', 'Speed-up']:
+        print(title.ljust(25), end='')
+    print()
+
+    for approach, make in [('list', ListDictionary), ('sortedlist', lambda: ListDictionary(sorted_mode=True)),
+                           ('hashtable', HashTableDictionary), ('tst', TernarySearchTreeDictionary)]:
+        agent = make()
+        agent.build_dictionary(words_frequencies)
+        delete_add_time = time_delete_add(agent, updates)
+        agent = make()
+        agent.build_dictionary(words_frequencies)
+        update_time = time_update_frequency(agent, updates)
+        print(approach.ljust(25) + format(delete_add_time, '.8f').ljust(25) + format(update_time, '.8f').ljust(25)
+              + format(delete_add_time / update_time, '.2f'))